@@ -0,0 +1,122 @@
+"""Micro-batching of concurrent chat queries."""
+
+import asyncio
+from concurrent.futures import Executor
+from typing import List, Optional, Set, Tuple
+
+from fastapi.concurrency import run_in_threadpool
+
+from app.chatbot.bot import TVSeriesBot
+
+
+class ChatBatcher:
+    """Collect concurrent chat queries into small batches for the bot."""
+
+    def __init__(
+            self,
+            bot: TVSeriesBot,
+            executor: Optional[Executor] = None,
+            max_batch_size: int = 8,
+            max_wait: float = 0.01
+    ):
+        """Initialize the batcher.
+
+        Args:
+            bot: Chatbot that processes each batch
+            executor: Executor that runs the blocking bot calls; defaults to the
+                event loop's shared threadpool
+            max_batch_size: Maximum number of queries handed to the bot at once
+            max_wait: Seconds to wait for more queries after the first one arrives
+        """
+        self.bot = bot
+        self.executor = executor
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._dispatching: Set[asyncio.Task] = set()
+
+    async def submit(self, message: str, session_id: Optional[str] = None) -> Tuple[str, str]:
+        """Queue a chat query and wait for its response.
+
+        Args:
+            message: User's query text
+            session_id: Optional session ID for conversation context
+
+        Returns:
+            Tuple of (response text, session ID)
+        """
+        if self._worker is None or self._worker.done():
+            self._queue = asyncio.Queue()
+            self._worker = asyncio.create_task(self._run())
+
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((message, session_id, future))
+        return await future
+
+    async def close(self) -> None:
+        """Stop the background worker and wait for batches already sent to the bot.
+
+        Queries that were queued but not yet dispatched are cancelled.
+        """
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+
+        # Let in-flight batches finish so the bot isn't shut down under them
+        if self._dispatching:
+            await asyncio.gather(*self._dispatching, return_exceptions=True)
+
+        if self._queue is not None:
+            while not self._queue.empty():
+                _, _, future = self._queue.get_nowait()
+                future.cancel()
+
+    async def _run(self) -> None:
+        """Drain the queue into batches and dispatch them to the bot."""
+        while True:
+            batch = [await self._queue.get()]
+            loop = asyncio.get_running_loop()
+            deadline = loop.time() + self.max_wait
+            try:
+                while len(batch) < self.max_batch_size:
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                    except asyncio.TimeoutError:
+                        break
+            except asyncio.CancelledError:
+                # Nobody will dispatch a half-collected batch, so release its callers
+                for _, _, future in batch:
+                    future.cancel()
+                raise
+
+            # Dispatch without awaiting so the next batch can start collecting
+            task = asyncio.create_task(self._dispatch(batch))
+            self._dispatching.add(task)
+            task.add_done_callback(self._dispatching.discard)
+
+    async def _dispatch(self, batch: List[Tuple[str, Optional[str], asyncio.Future]]) -> None:
+        """Process one batch and resolve each caller's future."""
+        queries = [(message, session_id) for message, session_id, _ in batch]
+        try:
+            if self.executor is not None:
+                loop = asyncio.get_running_loop()
+                results = await loop.run_in_executor(self.executor, self.bot.process_batch, queries)
+            else:
+                results = await run_in_threadpool(self.bot.process_batch, queries)
+        except Exception as e:
+            for _, _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, _, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
@@ -1,5 +1,7 @@
 """Main chatbot implementation."""
 
+import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Any, Optional, Tuple
 
 from app.tvdb.client import TVDBClient
@@ -8,16 +10,27 @@ from app.chatbot.memory import ConversationMemory
 from app.tvdb.models import UserQuery
 from app.controllers.movie_controller import MovieController
 
+logger = logging.getLogger(__name__)
+
 
 class TVSeriesBot:
     """Main chatbot class for TV series recommendations."""
 
-    def __init__(self):
-        """Initialize the TV series bot."""
-        self.tvdb_client = TVDBClient()
+    def __init__(self, tvdb_client: Optional[TVDBClient] = None):
+        """Initialize the TV series bot.
+
+        Args:
+            tvdb_client: Optional TVDB client to share; a new one is created if omitted
+        """
+        self.tvdb_client = tvdb_client or TVDBClient()
         self.llm_service = LLMService()
         self.memory = ConversationMemory()
         self.movie_controller = MovieController(self.tvdb_client, self.llm_service)
+        self._batch_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="chat")
+
+    def close(self) -> None:
+        """Release the bot's worker threads."""
+        self._batch_executor.shutdown(wait=False)
 
     def process_query(self, query_text: str, session_id: Optional[str] = None) -> Tuple[str, str]:
         """Process a user query and generate a response.
@@ -72,9 +85,37 @@ class TVSeriesBot:
 
         except Exception as e:
             error_msg = f"Sorry, I encountered an error: {str(e)}"
-            print(f"Error processing query: {str(e)}")
+            logger.warning("Error processing query: %s", e)
             return error_msg, session_id
 
+    def process_batch(self, queries: List[Tuple[str, Optional[str]]]) -> List[Tuple[str, str]]:
+        """Process several user queries concurrently.
+
+        Queries for the same session run in order so each one sees the context
+        left by the previous one; different sessions run in parallel and share
+        the TVDB client's cache and in-flight lookups.
+
+        Args:
+            queries: List of (query text, optional session ID) pairs
+
+        Returns:
+            List of (response text, session ID) tuples in the same order as queries
+        """
+        # Group query indexes by session; queries without a session start their own
+        groups: Dict[Any, List[int]] = {}
+        for index, (_, session_id) in enumerate(queries):
+            groups.setdefault(session_id or ("new", index), []).append(index)
+
+        results: List[Optional[Tuple[str, str]]] = [None] * len(queries)
+
+        def run_group(indexes: List[int]) -> None:
+            for index in indexes:
+                query_text, session_id = queries[index]
+                results[index] = self.process_query(query_text, session_id)
+
+        list(self._batch_executor.map(run_group, groups.values()))
+        return results
+
     def _handle_intent(self, query: UserQuery) -> Any:
         """Handle the user's intent and perform the appropriate action.
 
@@ -164,15 +205,20 @@ class TVSeriesBot:
                 # Get the series ID
                 series_id_str = results[0].get("id")
 
+                # The search result already lists the genres, so the similar-series
+                # lookup doesn't need to fetch the full series record for them
+                genres = results[0].get("genre")
+                series_details = {"genres": genres} if genres else None
+
                 # Extract numeric ID
                 if series_id_str and isinstance(series_id_str, str) and series_id_str.startswith("series-"):
                     try:
                         series_id = int(series_id_str.replace("series-", ""))
-                        return self.tvdb_client.get_similar_series(series_id)
+                        return self.tvdb_client.get_similar_series(series_id, series_details=series_details)
                     except ValueError:
                         return {"error": f"Invalid series ID format: {series_id_str}"}
                 elif series_id_str and isinstance(series_id_str, int):
-                    return self.tvdb_client.get_similar_series(series_id_str)
+                    return self.tvdb_client.get_similar_series(series_id_str, series_details=series_details)
                 else:
                     return {"error": f"Could not find valid ID for series '{series_name}'"}
 
@@ -221,7 +267,7 @@ class TVSeriesBot:
             )
 
             # Return current preferences
-            return {"preferences": self.memory.get_context("default_session").user_preferences.dict()}
+            return {"preferences": self.memory.get_context("default_session").user_preferences.model_dump()}
 
         elif intent == "help":
             # Return help information
@@ -244,7 +290,7 @@ class TVSeriesBot:
             season = params.get("season")
             episode = params.get("episode")
             # Add debug logging
-            print(f"Processing episode request: series='{series_name}', season={season}, episode={episode}")
+            logger.debug("Processing episode request: series='%s', season=%s, episode=%s", series_name, season, episode)
 
             # If query looks like "Series name episode X", parse it
             if not series_name and query.query_text:
@@ -277,7 +323,7 @@ class TVSeriesBot:
 
             # Get full information about the found series
             found_series = results[0]
-            print(f"Found series: {found_series.get('name')} with ID {found_series.get('id')}")
+            logger.debug("Found series: %s with ID %s", found_series.get('name'), found_series.get('id'))
 
             # Get the details for the first result
             series_id_str = found_series.get("id")
@@ -301,7 +347,7 @@ class TVSeriesBot:
                 return {"error": f"Could not find valid ID for series '{series_name}'"}
 
             # Get episodes for the specified season
-            print(f"Getting episodes for series ID {series_id}, season {season}")
+            logger.debug("Getting episodes for series ID %s, season %s", series_id, season)
             episodes = self.tvdb_client.get_series_episodes_by_season(series_id, season_number=season)
 
             # Add series name to the response for context
@@ -364,7 +410,7 @@ class TVSeriesBot:
             if not series_name:
                 return {"error": "Please specify a TV series name to see its awards"}
 
-            print(f"Looking for awards for series: {series_name}")
+            logger.debug("Looking for awards for series: %s", series_name)
 
             # Search for the series
             results = self.tvdb_client.search_series(series_name, limit=1)
@@ -395,7 +441,7 @@ class TVSeriesBot:
                 return {"error": f"Could not find valid ID for series '{series_name}'"}
 
             # Get awards for the series
-            print(f"Getting awards for series ID {series_id}")
+            logger.debug("Getting awards for series ID %s", series_id)
             awards = self.tvdb_client.get_series_awards(series_id)
 
             # Add series name to the response for context
@@ -427,7 +473,7 @@ class TVSeriesBot:
             elif isinstance(movie_id_str, str):
                 if movie_id_str.startswith("movie-"):
                     try:
-                        movie_id = int(movie_id_str.replace("movie-", ""))
+                        movie_id = int(movie_id_str[len("movie-"):])
                     except ValueError:
                         return {"error": f"Invalid movie ID format: {movie_id_str}"}
                 else:
@@ -519,7 +565,7 @@ class TVSeriesBot:
                     try:
                         series_id = int(series_id_str.replace("series-", ""))
                         # Get the series details including characters
-                        series_details = self.tvdb_client.get_series_details(series_id)
+                        series_details = self.tvdb_client.get_series_details(series_id, fields=("characters",))
 
                         # Find the character in the series
                         characters = series_details.get("characters", [])
@@ -1,6 +1,7 @@
 """LLM service for natural language understanding and generation."""
 
 import json
+import logging
 import os
 from typing import Dict, List, Optional, Any, Tuple
 
@@ -9,6 +10,8 @@ from dotenv import load_dotenv
 
 from app.tvdb.models import UserQuery, ConversationContext
 
+logger = logging.getLogger(__name__)
+
 # Load environment variables
 load_dotenv()
 
@@ -43,7 +46,7 @@ class LLMService:
             Parsed user query with intent and parameters
         """
         # Build the prompt for the LLM
-        print(f"LLM Service: Attempting to parse query: '{query}'")
+        logger.debug("Attempting to parse query: '%s'", query)
 
         system_message = """
         You are an assistant that helps parse user queries about TV series and movies into structured intents and parameters.
@@ -183,7 +186,7 @@ class LLMService:
             messages.append({"role": "user", "content": query})
 
         try:
-            print(f"LLM Service: Making API call to OpenAI")
+            logger.debug("Making API call to OpenAI")
             # Make the API call
             response = self.client.chat.completions.create(
                 model=self.model,
@@ -191,7 +194,7 @@ class LLMService:
                 temperature=0.2,  # Low temperature for more deterministic outputs
                 max_tokens=300
             )
-            print(f"LLM Service: OpenAI API call successful")
+            logger.debug("OpenAI API call successful")
 
             # Parse the response
             content = response.choices[0].message.content
@@ -219,8 +222,8 @@ class LLMService:
                         parameters=parsed_data["parameters"]
                     )
             except (json.JSONDecodeError, ValueError) as e:
-                print(f"Error parsing LLM response: {str(e)}")
-                print(f"Raw response: {content}")
+                logger.warning("Error parsing LLM response: %s", e)
+                logger.debug("Raw response: %s", content)
                 # If JSON parsing fails, default to help intent
                 pass
 
@@ -233,7 +236,7 @@ class LLMService:
 
         except Exception as e:
             # Handle any API errors
-            print(f"Error calling OpenAI API: {str(e)}")
+            logger.warning("Error calling OpenAI API: %s", e)
             return UserQuery(
                 queryText=query,
                 intent="help",
@@ -373,11 +376,11 @@ class LLMService:
 
                     return retry_response.choices[0].message.content
                 except Exception as retry_error:
-                    print(f"Error in retry attempt: {retry_error}")
+                    logger.warning("Error in retry attempt: %s", retry_error)
                     return "I found information about this movie but couldn't process all the details due to the large amount of data. Please try asking about specific aspects like the plot, director, or main cast."
 
             # Handle any other API errors
-            print(f"Error calling OpenAI API: {e}")
+            logger.warning("Error calling OpenAI API: %s", e)
             return "I'm having trouble generating a response right now. Please try again later."
 
     def _format_search_results_with_limits(self, results: Any, intent: str) -> Dict:
@@ -530,7 +533,7 @@ class LLMService:
         """
         # Handle unexpected string results
         if isinstance(results, str):
-            print(f"Warning: Received string instead of object: {results}")
+            logger.warning("Received string instead of object: %s", results)
             return {"error": "Unexpected string response", "message": results}
 
         # Handle error messages in results
@@ -1,11 +1,22 @@
 """Controller for handling movie-related requests."""
 
+import logging
 from typing import Dict, List, Optional, Any
 
 from app.tvdb.client import TVDBClient
 from app.chatbot.llm_service import LLMService
 from app.tvdb.models import UserQuery, ConversationContext
 
+logger = logging.getLogger(__name__)
+
+
+def _genre_names(movie: Dict) -> List[str]:
+    """Extract lowercase genre names from a movie, whatever format the API used."""
+    movie_genres = movie.get("genres") or []
+    if movie_genres and isinstance(movie_genres[0], dict):
+        return [g.get("name", "").lower() for g in movie_genres]
+    return [str(g).lower() for g in movie_genres]
+
 
 class MovieController:
     """Controller for handling movie-related requests."""
@@ -65,14 +76,14 @@ class MovieController:
             except ValueError:
                 limit = 5
 
-        print(f"Movie search request: movie_name='{movie_name}', genre='{genre}', year={year}, director='{director}'")
+        logger.debug("Movie search request: movie_name='%s', genre='%s', year=%s, director='%s'", movie_name, genre, year, director)
 
         # Try specialized search first if we have director
         if director:
-            print(f"Searching for movies by director: {director}")
+            logger.debug("Searching for movies by director: %s", director)
             director_results = self.tvdb_client.get_movies_by_director(director, limit=limit)
             if director_results:
-                print(f"Found {len(director_results)} movies by director {director}")
+                logger.debug("Found %s movies by director %s", len(director_results), director)
                 return {
                     "search_params": {
                         "director_name": director,
@@ -89,7 +100,7 @@ class MovieController:
             results = []
 
             # Try direct movie search
-            print(f"Searching for movies with name: {movie_name}")
+            logger.debug("Searching for movies with name: %s", movie_name)
             try:
                 search_results = self.tvdb_client.search_movies(
                     query=movie_name,
@@ -101,33 +112,22 @@ class MovieController:
                 )
 
                 if search_results:
-                    print(f"Found {len(search_results)} results for movie name '{movie_name}'")
+                    logger.debug("Found %s results for movie name '%s'", len(search_results), movie_name)
 
                     # Filter by genre if specified
                     if genre and len(search_results) > 0:
-                        print(f"Filtering results by genre: {genre}")
-                        filtered_results = []
-                        for movie in search_results:
-                            # Get genre info from the movie
-                            movie_genres = movie.get("genres", [])
-                            genre_names = []
-
-                            # Extract genre names based on format
-                            if movie_genres:
-                                if isinstance(movie_genres[0], dict):
-                                    genre_names = [g.get("name", "").lower() for g in movie_genres]
-                                else:
-                                    genre_names = [str(g).lower() for g in movie_genres]
-
-                            # Check if movie matches the genre
-                            if genre.lower() in " ".join(genre_names).lower():
-                                filtered_results.append(movie)
+                        logger.debug("Filtering results by genre: %s", genre)
+                        genre_lower = genre.lower()
+                        filtered_results = [
+                            movie for movie in search_results
+                            if genre_lower in " ".join(_genre_names(movie))
+                        ]
 
                         if filtered_results:
-                            print(f"Found {len(filtered_results)} results after genre filtering")
+                            logger.debug("Found %s results after genre filtering", len(filtered_results))
                             results = filtered_results
                         else:
-                            print(f"No results match genre '{genre}', using unfiltered results")
+                            logger.debug("No results match genre '%s', using unfiltered results", genre)
                             results = search_results
                     else:
                         results = search_results
@@ -145,14 +145,14 @@ class MovieController:
                         "count": len(results)
                     }
             except Exception as e:
-                print(f"Error in movie search: {e}")
+                logger.warning("Error in movie search: %s", e)
 
         # If we only have a genre, use genre-based search
         if genre and not results:
-            print(f"Searching for movies by genre: {genre}")
+            logger.debug("Searching for movies by genre: %s", genre)
             genre_results = self.tvdb_client.get_movies_by_genre(genre, limit=limit)
             if genre_results:
-                print(f"Found {len(genre_results)} movies in genre {genre}")
+                logger.debug("Found %s movies in genre %s", len(genre_results), genre)
                 return {
                     "search_params": {
                         "genre": genre,
@@ -164,7 +164,7 @@ class MovieController:
                 }
 
         # If all specific searches failed, try the safe search method
-        print("Using safe search method as fallback")
+        logger.debug("Using safe search method as fallback")
         safe_results = self.tvdb_client.safe_search_movies(
             query=movie_name,
             genre=genre,
@@ -173,7 +173,7 @@ class MovieController:
         )
 
         if safe_results:
-            print(f"Safe search found {len(safe_results)} results")
+            logger.debug("Safe search found %s results", len(safe_results))
             return {
                 "search_params": {
                     "movie_name": movie_name,
@@ -229,7 +229,7 @@ class MovieController:
         if isinstance(movie_id, str):
             if movie_id.startswith("movie-"):
                 try:
-                    movie_id = int(movie_id.replace("movie-", ""))
+                    movie_id = int(movie_id[len("movie-"):])
                 except ValueError:
                     return {"error": f"Invalid movie ID format: {movie_id}"}
 
@@ -269,7 +269,7 @@ class MovieController:
         if isinstance(movie_id, str):
             if movie_id.startswith("movie-"):
                 try:
-                    movie_id = int(movie_id.replace("movie-", ""))
+                    movie_id = int(movie_id[len("movie-"):])
                 except ValueError:
                     return {"error": f"Invalid movie ID format: {movie_id}"}
 
@@ -326,7 +326,7 @@ class MovieController:
         if isinstance(movie_id, str):
             if movie_id.startswith("movie-"):
                 try:
-                    movie_id = int(movie_id.replace("movie-", ""))
+                    movie_id = int(movie_id[len("movie-"):])
                 except ValueError:
                     return {"error": f"Invalid movie ID format: {movie_id}"}
 
@@ -360,11 +360,11 @@ class MovieController:
             directors = [directors]
 
         # Log what we're doing
-        print(f"Movie recommendation request with genres: {genres}, actors: {actors}, directors: {directors}")
+        logger.debug("Movie recommendation request with genres: %s, actors: %s, directors: %s", genres, actors, directors)
 
         # If no specific criteria, default to trending movies
         if not any([genres, actors, directors]):
-            print("No specific criteria provided, fetching trending movies")
+            logger.debug("No specific criteria provided, fetching trending movies")
             trending_movies = self.tvdb_client.get_trending_movies(limit=5)
 
             if trending_movies:
@@ -374,7 +374,7 @@ class MovieController:
                 }
             else:
                 # Try a general search for popular movies
-                print("No trending movies found, searching for popular movies")
+                logger.debug("No trending movies found, searching for popular movies")
                 popular_movies = self.tvdb_client.search_movies(query="popular", limit=5)
                 if popular_movies:
                     return {
@@ -397,12 +397,12 @@ class MovieController:
             # Add favorite genres if none specified
             if not genres and prefs.favorite_genres:
                 genres.extend(prefs.favorite_genres)
-                print(f"Added genres from user preferences: {prefs.favorite_genres}")
+                logger.debug("Added genres from user preferences: %s", prefs.favorite_genres)
 
             # Add favorite actors if none specified
             if not actors and prefs.favorite_actors:
                 actors.extend(prefs.favorite_actors)
-                print(f"Added actors from user preferences: {prefs.favorite_actors}")
+                logger.debug("Added actors from user preferences: %s", prefs.favorite_actors)
 
         # Create criteria dictionary
         criteria = {
@@ -412,11 +412,11 @@ class MovieController:
         }
 
         # Get recommended movies based on criteria
-        print(f"Recommending movies with criteria: {criteria}")
+        logger.debug("Recommending movies with criteria: %s", criteria)
         recommended_movies = self.tvdb_client.recommend_movies(criteria)
 
         if not recommended_movies:
-            print("No movies matched criteria, trying fallback options")
+            logger.debug("No movies matched criteria, trying fallback options")
 
             # Try each genre individually
             if genres:
@@ -469,14 +469,14 @@ class MovieController:
         limit = int(params.get("limit", 5))
         genre = params.get("genre")
 
-        print(f"Fetching trending movies (limit: {limit}, genre: {genre})")
+        logger.debug("Fetching trending movies (limit: %s, genre: %s)", limit, genre)
 
         # Try to get trending movies
         trending_movies = self.tvdb_client.get_trending_movies(limit=10)
 
         # If no trending movies, try a fallback search
         if not trending_movies:
-            print("No trending movies found, trying fallback search")
+            logger.debug("No trending movies found, trying fallback search")
             # Fallback: search for recent movies or popular movies
             fallback_movies = self.tvdb_client.search_movies(query="popular", limit=limit)
 
@@ -510,27 +510,18 @@ class MovieController:
 
         # Filter by genre if specified
         if genre:
-            print(f"Filtering trending movies by genre: {genre}")
-            filtered_movies = []
-            for movie in trending_movies:
-                movie_genres = movie.get("genres", [])
-                genre_names = []
-
-                # Extract genre names from different formats
-                if movie_genres:
-                    if isinstance(movie_genres[0], dict):
-                        genre_names = [g.get("name", "").lower() for g in movie_genres]
-                    else:
-                        genre_names = [g.lower() for g in movie_genres]
-
-                if genre.lower() in genre_names:
-                    filtered_movies.append(movie)
+            logger.debug("Filtering trending movies by genre: %s", genre)
+            genre_lower = genre.lower()
+            filtered_movies = [
+                movie for movie in trending_movies
+                if genre_lower in _genre_names(movie)
+            ]
 
             if filtered_movies:
                 trending_movies = filtered_movies
-                print(f"Found {len(filtered_movies)} {genre} movies")
+                logger.debug("Found %s %s movies", len(filtered_movies), genre)
             else:
-                print(f"No trending movies found for genre: {genre}")
+                logger.debug("No trending movies found for genre: %s", genre)
                 # If no movies match the genre, try a direct genre search
                 genre_movies = self.tvdb_client.get_movies_by_genre(genre, limit=limit)
                 if genre_movies:
@@ -1,24 +1,84 @@
 """Main FastAPI application for TV Series Recommender."""
 
+import logging
 import os
-from typing import Dict, List, Optional
+import queue
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from logging.handlers import QueueHandler, QueueListener
+from typing import Dict, List, Optional, Tuple
 
+import jinja2
+import orjson
 from fastapi import FastAPI, HTTPException, Depends
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, ORJSONResponse, Response
 from fastapi import Request
+from pydantic import TypeAdapter
 
-from app.tvdb.client import TVDBClient
+from app.tvdb.client import SERIES_ID_RE, TVDBClient
 from app.tvdb.models import ChatRequest, ChatResponse
+from app.chatbot.batcher import ChatBatcher
 from app.chatbot.bot import TVSeriesBot
 
+logger = logging.getLogger(__name__)
+
+
+def start_queue_logging() -> Tuple[QueueHandler, QueueListener]:
+    """Route log records through a queue so handlers write on a background thread.
+
+    Returns:
+        The handler installed on the root logger and the listener draining it
+    """
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s"))
+
+    log_queue = queue.SimpleQueue()
+    queue_handler = QueueHandler(log_queue)
+    listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+
+    root = logging.getLogger()
+    root.addHandler(queue_handler)
+    level = os.getenv("LOG_LEVEL", "INFO").upper()
+    # getLevelName maps a known name to its number and anything else to a string
+    valid_level = isinstance(logging.getLevelName(level), int)
+    root.setLevel(level if valid_level else logging.INFO)
+    listener.start()
+    if not valid_level:
+        logger.warning("Unknown LOG_LEVEL %r, falling back to INFO", level)
+    return queue_handler, listener
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Create the shared TVDB client and chatbot per worker and close them on shutdown."""
+    queue_handler, log_listener = start_queue_logging()
+    app.state.tvdb = TVDBClient()
+    app.state.bot = TVSeriesBot(tvdb_client=app.state.tvdb)
+    # Chat requests get their own threads so slow LLM calls can't starve the
+    # shared threadpool used by the search/series endpoints
+    app.state.chat_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="chat-endpoint")
+    app.state.chat_batcher = ChatBatcher(app.state.bot, executor=app.state.chat_executor)
+    yield
+    await app.state.chat_batcher.close()
+    app.state.chat_executor.shutdown(wait=False)
+    app.state.bot.close()
+    app.state.tvdb.close()
+    logging.getLogger().removeHandler(queue_handler)
+    log_listener.stop()
+
+
 # Create FastAPI app
 app = FastAPI(
     title="TV Series Recommender",
     description="A chatbot that helps users discover TV series based on their preferences using the TVDB API.",
-    version="0.2.0"
+    version="0.2.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
 )
 
 # Add CORS middleware
@@ -44,9 +104,53 @@ except RuntimeError:
     # Directory might not exist in development
     templates = None
 
-# Create TVDB client
-tvdb_client = TVDBClient()
-tv_series_bot = TVSeriesBot()
+if templates and os.getenv("ENV") == "production":
+    # Templates don't change in production: skip the mtime checks on every
+    # render and keep compiled bytecode across restarts
+    templates.env.auto_reload = False
+    bytecode_dir = os.path.join(tempfile.gettempdir(), "tvbot_jinja")
+    os.makedirs(bytecode_dir, exist_ok=True)
+    templates.env.bytecode_cache = jinja2.FileSystemBytecodeCache(bytecode_dir)
+
+if templates:
+    # Compile the index page now so the first request doesn't pay for it
+    try:
+        templates.get_template("index.html")
+    except jinja2.TemplateNotFound:
+        pass
+
+# The health check body never changes, so serialize it once
+HEALTH_BODY = orjson.dumps({"status": "ok"})
+
+# Built once so chat responses serialize straight to JSON bytes without
+# going through FastAPI's generic encoder
+CHAT_RESPONSE_ADAPTER = TypeAdapter(ChatResponse)
+
+def get_tvdb_client(request: Request) -> TVDBClient:
+    """Return the worker's shared TVDB client."""
+    return request.app.state.tvdb
+
+
+def get_chat_batcher(request: Request) -> ChatBatcher:
+    """Return the worker's chat batcher."""
+    return request.app.state.chat_batcher
+
+
+def resolve_series_id(tvdb_client: TVDBClient, series_id: str) -> Optional[int]:
+    """Resolve a series ID string or series name to a numeric TVDB ID.
+
+    Args:
+        tvdb_client: Client used to look up series names
+        series_id: Numeric ID, "series-<id>" string, or series name
+
+    Returns:
+        The numeric series ID, or None if no series matches
+    """
+    match = SERIES_ID_RE.match(series_id)
+    if match:
+        return int(match.group(1))
+
+    return tvdb_client.resolve_series_name(series_id)
 
 
 @app.get("/", response_class=HTMLResponse)
@@ -58,38 +162,25 @@ async def read_root(request: Request):
 
 
 @app.get("/api/search/{query}")
-async def search_series(query: str, limit: int = 5):
+async def search_series(query: str, limit: int = 5, tvdb_client: TVDBClient = Depends(get_tvdb_client)):
     """Search for TV series by name."""
     try:
-        results = tvdb_client.search_series(query, limit=limit)
+        results = await run_in_threadpool(tvdb_client.search_series, query, limit=limit)
         return {"results": results}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @app.get("/api/series/{series_id}")
-async def get_series(series_id: str):
+async def get_series(series_id: str, tvdb_client: TVDBClient = Depends(get_tvdb_client)):
     """Get detailed information about a TV series."""
     try:
-        # Extract numeric ID from the series ID string (e.g., "series-81189" -> 81189)
-        numeric_id = None
-        if series_id.startswith("series-"):
-            numeric_id = int(series_id.replace("series-", ""))
-        else:
-            try:
-                numeric_id = int(series_id)
-            except ValueError:
-                # If it's not a numeric ID, search for the series first
-                results = tvdb_client.search_series(series_id, limit=1)
-                if results:
-                    series_id = results[0].get("id")
-                    if series_id and series_id.startswith("series-"):
-                        numeric_id = int(series_id.replace("series-", ""))
+        numeric_id = await run_in_threadpool(resolve_series_id, tvdb_client, series_id)
 
         if not numeric_id:
             raise HTTPException(status_code=404, detail="Series not found")
 
-        details = tvdb_client.get_series_details(numeric_id)
+        details = await run_in_threadpool(tvdb_client.get_series_details, numeric_id)
         return {"details": details}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -146,44 +237,38 @@ async def get_series(series_id: str):
 #         raise HTTPException(status_code=500, detail=str(e))
 
 @app.post("/api/chat", response_model=ChatResponse)
-async def chat(request: ChatRequest):
+async def chat(request: ChatRequest, chat_batcher: ChatBatcher = Depends(get_chat_batcher)):
     """Process a chat message using the LLM-powered chatbot."""
     try:
         # Process the message through the chatbot
-        response_text, session_id = tv_series_bot.process_query(
+        response_text, session_id = await chat_batcher.submit(
             request.message,
             session_id=request.session_id
         )
 
-        return ChatResponse(message=response_text, session_id=session_id)
+        return Response(
+            content=CHAT_RESPONSE_ADAPTER.dump_json(ChatResponse(message=response_text, session_id=session_id)),
+            media_type="application/json"
+        )
     except Exception as e:
-        print(f"Error in chat endpoint: {str(e)}")
+        logger.exception("Error in chat endpoint")
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @app.get("/api/similar/{series_id}")
-async def get_similar(series_id: str, limit: int = 5):
+async def get_similar(
+        series_id: str,
+        limit: int = 5,
+        tvdb_client: TVDBClient = Depends(get_tvdb_client)
+):
     """Get similar TV series recommendations."""
     try:
-        # Extract numeric ID from the series ID string (e.g., "series-81189" -> 81189)
-        numeric_id = None
-        if series_id.startswith("series-"):
-            numeric_id = int(series_id.replace("series-", ""))
-        else:
-            try:
-                numeric_id = int(series_id)
-            except ValueError:
-                # If it's not a numeric ID, search for the series first
-                results = tvdb_client.search_series(series_id, limit=1)
-                if results:
-                    series_id = results[0].get("id")
-                    if series_id and series_id.startswith("series-"):
-                        numeric_id = int(series_id.replace("series-", ""))
+        numeric_id = await run_in_threadpool(resolve_series_id, tvdb_client, series_id)
 
         if not numeric_id:
             raise HTTPException(status_code=404, detail="Series not found")
 
-        similar = tvdb_client.get_similar_series(numeric_id)
+        similar = await run_in_threadpool(tvdb_client.get_similar_series, numeric_id)
         return {"similar": similar[:limit]}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -192,4 +277,4 @@ async def get_similar(series_id: str, limit: int = 5):
 @app.get("/api/health")
 async def health_check():
     """Health check endpoint."""
-    return {"status": "ok"}
+    return Response(content=HEALTH_BODY, media_type="application/json")
@@ -0,0 +1,173 @@
+"""In-process caching helpers for the TVDB client."""
+
+import copy
+import functools
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+_MISSING = object()
+
+
+class TTLCache:
+    """Thread-safe mapping whose entries expire after a time-to-live.
+
+    With a ``stale_ttl``, expired entries are kept that much longer so
+    ``get_stale`` can still serve them, e.g. while the upstream API is down.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 3600, stale_ttl: float = 0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self._data: Dict[Hashable, Tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value for a key, or default if missing or expired."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+            expires, value = entry
+            now = time.monotonic()
+            if expires <= now:
+                if expires + self.stale_ttl <= now:
+                    del self._data[key]
+                return default
+            return value
+
+    def get_stale(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value for a key even if expired, within the stale window."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+            expires, value = entry
+            if expires + self.stale_ttl <= time.monotonic():
+                del self._data[key]
+                return default
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """Store a value, optionally overriding the default time-to-live."""
+        now = time.monotonic()
+        with self._lock:
+            if key not in self._data and len(self._data) >= self.maxsize:
+                self._evict(now)
+            self._data[key] = (now + (self.ttl if ttl is None else ttl), value)
+
+    def invalidate(self, key: Optional[Hashable] = None) -> None:
+        """Drop a single key, or every entry when no key is given."""
+        with self._lock:
+            if key is None:
+                self._data.clear()
+            else:
+                self._data.pop(key, None)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def _evict(self, now: float) -> None:
+        """Make room for one entry: purge dead items, else drop the oldest."""
+        dead = [k for k, (expires, _) in self._data.items() if expires + self.stale_ttl <= now]
+        for k in dead:
+            del self._data[k]
+        if len(self._data) >= self.maxsize:
+            del self._data[next(iter(self._data))]
+
+
+class SingleFlight:
+    """Coalesce concurrent calls for the same key onto a single execution."""
+
+    def __init__(self):
+        self._calls: Dict[Hashable, Future] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        """Run fn for key, or wait for the call already in flight for that key.
+
+        Args:
+            key: Identifies duplicate calls
+            fn: Zero-argument callable doing the actual work
+
+        Returns:
+            The result of fn, shared by every caller that arrived while it ran
+        """
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if leader:
+                future = Future()
+                self._calls[key] = future
+
+        if not leader:
+            return future.result()
+
+        try:
+            result = fn()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+
+def cached(
+        ttl: Optional[float] = None,
+        negative_ttl: float = 60,
+        key: Optional[Callable[..., Hashable]] = None
+) -> Callable:
+    """Cache a client method's results in the instance's ``_cache``.
+
+    Concurrent misses for the same key are coalesced through the instance's
+    ``_inflight`` SingleFlight, so only one of them reaches the API. Every
+    caller gets its own deep copy of the result, so mutating it never
+    touches the cached value.
+
+    Args:
+        ttl: Lifetime of non-empty results; defaults to the cache's TTL
+        negative_ttl: Shorter lifetime for empty results so misses are retried soon
+        key: Builds the cache key from the call's arguments; defaults to the raw arguments
+
+    Returns:
+        A decorator for TVDBClient methods
+    """
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            if key is not None:
+                cache_key = (func.__name__, key(*args, **kwargs))
+            else:
+                cache_key = (func.__name__, args, frozenset(kwargs.items()))
+
+            value = self._cache.get(cache_key, _MISSING)
+            if value is not _MISSING:
+                return copy.deepcopy(value)
+
+            def load():
+                # A call that finished just before we got here may have filled the cache
+                value = self._cache.get(cache_key, _MISSING)
+                if value is not _MISSING:
+                    return value
+
+                try:
+                    value = func(self, *args, **kwargs)
+                except Exception:
+                    # Never serve a stale entry for a key whose refresh just failed
+                    self._cache.invalidate(cache_key)
+                    raise
+
+                self._cache.set(cache_key, value, ttl=ttl if value else negative_ttl)
+                return value
+
+            return copy.deepcopy(self._inflight.do(cache_key, load))
+
+        return wrapper
+
+    return decorator
@@ -1,20 +1,59 @@
 """TVDB API client implementation."""
 
+import copy
+import hashlib
+import logging
 import os
+import re
+import threading
 import time
-from typing import Dict, List, Optional, Any
+from collections import defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, Optional, Any, Tuple
+from app.tvdb.cache import SingleFlight, TTLCache, cached
 from app.tvdb.models import Episode, Series, SearchResult, SeriesBase
 
+import ijson
 import requests
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+from urllib3.util import make_headers
+from urllib3.util.retry import Retry
 
-# Load environment variables from .env file
-load_dotenv()
+try:
+    import orjson
+
+    json_loads = orjson.loads
+    json_dumps = orjson.dumps
+    JSONDecodeError = orjson.JSONDecodeError
+except ImportError:
+    # orjson is a speed-up, not a requirement; fall back to the stdlib parser
+    import json
+
+    json_loads = json.loads
+    JSONDecodeError = json.JSONDecodeError
+
+    def json_dumps(obj: Any) -> bytes:
+        """Serialize to compact JSON bytes, like orjson.dumps."""
+        return json.dumps(obj, separators=(",", ":")).encode()
+
+logger = logging.getLogger(__name__)
 
 # TVDB API Configuration
 TVDB_API_URL = "https://api4.thetvdb.com/v4"
-TVDB_API_KEY = os.getenv("TVDB_API_KEY")
-TVDB_PIN = os.getenv("TVDB_PIN")
+
+# (connect, read) timeouts in seconds so a stalled connection can't hang a worker
+REQUEST_TIMEOUT = (3.05, 27)
+
+# Seconds before expiry at which the access token is renewed
+TOKEN_REFRESH_MARGIN = 60 * 60
+
+# Where access tokens are kept between runs
+TOKEN_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "tv-bot-recommender")
+
+# How many more search rows to request when results are filtered client-side
+SEARCH_OVERFETCH_FACTOR = 4
 
 
 class TVDBError(Exception):
@@ -26,1326 +65,263 @@ class TVDBError(Exception):
         super().__init__(f"TVDB API Error ({status_code}): {message}")
 
 
+# Popular shows returned by get_shows_by_network when TVDB has nothing, by case-folded network
+NETWORK_FALLBACKS = {
+    "hbo": (
+        {
+            "id": "series-82730",
+            "name": "Game of Thrones",
+            "network": "HBO",
+            "overview": "Seven noble families fight for control of the mythical land of Westeros.",
+            "status": {"name": "Ended"}
+        },
+        {
+            "id": "series-374220",
+            "name": "Succession",
+            "network": "HBO",
+            "overview": "The Roy family controls one of the biggest media and entertainment conglomerates in the world.",
+            "status": {"name": "Ended"}
+        },
+        {
+            "id": "series-371572",
+            "name": "House of the Dragon",
+            "network": "HBO",
+            "overview": "The story of House Targaryen, 200 years before the events of Game of Thrones.",
+            "status": {"name": "Continuing"}
+        },
+    ),
+}
+
+# Every encoding urllib3 can decode here; brotli is only offered when installed
+ACCEPT_ENCODING = make_headers(accept_encoding=True)["accept-encoding"]
+
+# How long successful GET responses are cached, by endpoint; first match wins
+RESPONSE_TTLS = [
+    (re.compile(r"^/awards"), 24 * 60 * 60),
+    (re.compile(r"^/series/\d+/nextAired"), 60),
+    (re.compile(r"^/series/\d+/extended"), 60 * 60),
+    (re.compile(r"^/seasons/\d+/extended"), 60 * 60),
+    (re.compile(r"^/networks"), 24 * 60 * 60),
+    (re.compile(r"^/search"), 10 * 60),
+]
+DEFAULT_RESPONSE_TTL = 5 * 60
+
+# How long past expiry a cached response may still be served if TVDB is failing
+STALE_RESPONSE_TTL = 24 * 60 * 60
+
+# Matches "81189" as well as "series-81189"
+SERIES_ID_RE = re.compile(r"^(?:series-)?(\d+)$")
+
+
+def _response_ttl(endpoint: str) -> int:
+    """Pick the cache lifetime for a GET response from its endpoint."""
+    for pattern, ttl in RESPONSE_TTLS:
+        if pattern.match(endpoint):
+            return ttl
+    return DEFAULT_RESPONSE_TTL
+
+
+def _season_key(season: Any) -> Any:
+    """Normalize a season number so 2, "2" and 2.0 index the same season."""
+    try:
+        return int(season)
+    except (TypeError, ValueError):
+        return season
+
+
+def _search_series_key(
+        query: str,
+        limit: int = 5,
+        year: Optional[int] = None,
+        country: Optional[str] = None,
+        network: Optional[str] = None,
+        status: Optional[str] = None,
+        genre: Optional[str] = None
+) -> tuple:
+    """Build the cache key for a search_series call."""
+    return query.casefold(), limit, year, country, network, status, genre
+
+
+def _normalize_series(result: Any, genre_key: str = "genre") -> Any:
+    """Map a raw series search hit onto the fields the bot relies on.
+
+    Args:
+        result: Raw result from the TVDB API; anything but a dict is passed through
+        genre_key: Key to store the genre list under
+
+    Returns:
+        The normalized result
+    """
+    if not isinstance(result, dict):
+        return result
+
+    get = result.get
+    status = get("status", "")
+    return {
+        "id": get("id", get("tvdb_id")),
+        "name": get("name", get("title", "")),
+        "overview": get("overview", ""),
+        "year": get("year", ""),
+        "status": {"id": 0, "name": status} if isinstance(status, str) else status,
+        "network": get("network", ""),
+        genre_key: get("genres", []),
+        "image_url": get("image_url", get("poster", get("thumbnail", ""))),
+    }
+
+
 class TVDBClient:
     """Client for interacting with the TVDB API."""
 
     def __init__(self):
+        # Read credentials when a client is built rather than at import time,
+        # so importing this module doesn't parse .env
+        load_dotenv()
         self.api_url = TVDB_API_URL
-        self.api_key = TVDB_API_KEY
-        self.pin = TVDB_PIN
+        self.api_key = os.getenv("TVDB_API_KEY")
+        self.pin = os.getenv("TVDB_PIN")
         self.token = None
         self.token_expires = 0
+        self._token_lock = threading.Lock()
         self.headers = {"Content-Type": "application/json"}
 
-    def _ensure_token(self):
-        """Ensure a valid token is available for API requests."""
-        current_time = time.time()
-
-        # If token is expired or not set, get a new one
-        if not self.token or current_time >= self.token_expires:
-            self._login()
-
-    def _login(self):
-        """Authenticate with the TVDB API and get an access token."""
-        login_url = f"{self.api_url}/login"
-        payload = {
-            "apikey": self.api_key,
-        }
-
-        if self.pin:
-            payload["pin"] = self.pin
-
-        response = requests.post(login_url, json=payload)
-
-        if response.status_code != 200:
-            raise TVDBError(
-                response.status_code,
-                f"Authentication failed: {response.text}"
-            )
-
-        data = response.json()
-        self.token = data["data"]["token"]
-        # Token expires in 1 month, but we'll set it to expire in 29 days to be safe
-        self.token_expires = time.time() + (29 * 24 * 60 * 60)
-        self.headers["Authorization"] = f"Bearer {self.token}"
-
-    def _make_request(
-            self,
-            method: str,
-            endpoint: str,
-            params: Optional[Dict] = None,
-            data: Optional[Dict] = None
-    ) -> Dict:
-        """Make a request to the TVDB API."""
-        self._ensure_token()
-
-        url = f"{self.api_url}{endpoint}"
-
-        try:
-            response = requests.request(
-                method,
-                url,
-                headers=self.headers,
-                params=params,
-                json=data
+        # Reuse keep-alive connections to the API instead of opening a new
+        # TCP/TLS connection per call; transient gateway errors are retried.
+        self._session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=32,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.5,
+                status_forcelist=[429, 500, 502, 503, 504],
+                allowed_methods=frozenset(["GET", "POST"]),
+                respect_retry_after_header=True,
+                # Hand the last response back so its status ends up in TVDBError
+                raise_on_status=False
             )
+        )
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+        self._session.headers.update(self.headers)
+        self._session.headers["Accept-Encoding"] = ACCEPT_ENCODING
 
-            if response.status_code == 401:
-                # Token might be expired, try to get a new one
-                self.token = None
-                self._ensure_token()
-
-                # Retry the request
-                response = requests.request(
-                    method,
-                    url,
-                    headers=self.headers,
-                    params=params,
-                    json=data
-                )
-
-            if response.status_code != 200:
-                raise TVDBError(
-                    response.status_code,
-                    f"API request failed: {response.text}"
-                )
-
-            return response.json()
-
-        except requests.exceptions.RequestException as e:
-            raise TVDBError(500, f"Request failed: {str(e)}")
-
-    def search_series(
-            self,
-            query: str,
-            limit: int = 5,
-            year: Optional[int] = None,
-            country: Optional[str] = None,
-            network: Optional[str] = None,
-            status: Optional[str] = None,
-            genre: Optional[str] = None
-    ) -> List[Dict]:
-        """Search for TV series by name."""
-        # Build search parameters according to API documentation
-        params = {
-            "query": query,  # Use the correct 'query' parameter as shown in the docs
-            "type": "series"  # Specify we want series results
-        }
-
-        # Add additional filters if provided
-        if year:
-            params["year"] = str(year)
-        if country:
-            params["country"] = country
-        if network:
-            params["network"] = network
-
-        # Print request details for debugging
-        print(f"Searching for series with params: {params}")
-        print(f"Full URL: {self.api_url}/search with headers: {self.headers}")
-
-        try:
-            response = self._make_request("GET", "/search", params=params)
-
-            # Print raw response for debugging
-            print(f"Response status: {response.get('status', 'No status')}")
-            print(f"Response data count: {len(response.get('data', []))}")
-
-            results = response.get("data", [])
-
-            if not results:
-                print(f"No results found for query: '{query}'")
-                return []
-
-            print(f"Found {len(results)} results for '{query}'")
-
-            # Format and validate results
-            validated_results = []
-            for result in results:
-                try:
-                    # Extract key information - handle different possible formats
-                    series_info = {
-                        "id": result.get("id", result.get("tvdb_id")),
-                        "name": result.get("name", result.get("title", "")),
-                        "overview": result.get("overview", ""),
-                        "year": result.get("year", ""),
-                        "status": result.get("status", ""),
-                        "network": result.get("network", ""),
-                        "genre": result.get("genres", []),
-                        "image_url": result.get("image_url", result.get("poster", result.get("thumbnail", ""))),
-                    }
-
-                    # Apply custom transformations if needed
-                    if isinstance(series_info["status"], str):
-                        series_info["status"] = {"id": 0, "name": series_info["status"]}
-
-                    # Add to results
-                    validated_results.append(series_info)
-
-                except Exception as e:
-                    print(f"Error processing result: {str(e)}")
-                    # Add the original item as fallback
-                    validated_results.append(result)
-
-            print(f"Processed {len(validated_results)} valid results")
-
-            # Apply additional filtering if needed
-            if status or genre:
-                filtered_results = []
-                for series in validated_results:
-                    if status and isinstance(series.get("status"), dict):
-                        if status.lower() not in series["status"].get("name", "").lower():
-                            continue
-                    elif status and isinstance(series.get("status"), str):
-                        if status.lower() not in series["status"].lower():
-                            continue
-
-                    if genre and series.get("genre"):
-                        genre_match = False
-                        for g in series["genre"]:
-                            if isinstance(g, str) and genre.lower() in g.lower():
-                                genre_match = True
-                                break
-                            elif isinstance(g, dict) and genre.lower() in g.get("name", "").lower():
-                                genre_match = True
-                                break
-                        if not genre_match:
-                            continue
-
-                    filtered_results.append(series)
-
-                validated_results = filtered_results
-                print(f"After filtering: {len(validated_results)} results")
-
-            # Return limited results
-            return validated_results[:limit]
-
-        except Exception as e:
-            print(f"Search error: {str(e)}")
-            return []
-
-    def get_series_details(self, series_id: int) -> Dict:
-        """Get detailed information about a TV series.
-
-        Args:
-            series_id: The ID of the TV series
-
-        Returns:
-            Details about the TV series
-        """
-        response = self._make_request("GET", f"/series/{series_id}/extended")
-        return response.get("data", {})
-
-    def get_series_cast(self, series_id: int) -> List[Dict]:
-        """Get the cast of a TV series."""
-        response = self._make_request("GET", f"/series/{series_id}/extended")
-        return response.get("data", {}).get("characters", [])
-
-    def get_similar_series(self, series_id: int) -> List[Dict]:
-        """Get similar TV series recommendations based on genres."""
-        series_details = self.get_series_details(series_id)
-
-        # Get the genres of the series
-        genres = [genre.get("name") for genre in series_details.get("genres", [])]
-
-        if not genres:
-            return []
-
-        # Use the first genre to search for similar shows
-        primary_genre = genres[0]
-        search_results = self.search_series(primary_genre, limit=10)
-
-        # Filter out the original series
-        similar_series = [
-            series for series in search_results
-            if series.get("id") != series_id
-        ]
-
-        return similar_series[:5]  # Return up to 5 similar series
-
-    def get_series_by_network(self, network: str, limit: int = 5) -> List[Dict]:
-        """Get TV series by network."""
-        # First, find the network ID
-        networks = self._make_request("GET", "/networks").get("data", [])
-        network_id = None
-
-        for n in networks:
-            if network.lower() in n.get("name", "").lower():
-                network_id = n.get("id")
-                break
-
-        if not network_id:
-            return []
-
-        # Then search for series on that network
-        params = {
-            "network": network_id,
-            "limit": limit
-        }
-
-        response = self._make_request("GET", "/series", params=params)
-        return response.get("data", [])
-
-    # Add these methods to your TVDBClient class in app/tvdb/client.py
-
-    def get_series_episodes_by_season(self, series_id: int, season_number: Optional[int] = None) -> List[Dict]:
-        """Get episodes of a TV series by season number."""
-        try:
-            # Existing code to fetch episodes
-            season_type = "default"
-            endpoint = f"/series/{series_id}/episodes/{season_type}"
-            print(f"Fetching episodes from endpoint: {endpoint}")
-
-            response = self._make_request("GET", endpoint)
-            all_episodes_data = response.get("data", [])
-
-            if not all_episodes_data:
-                print(f"No episodes found for series {series_id}")
-                return []
-
-            print(f"Found {len(all_episodes_data)} total episodes for series {series_id}")
-
-            # Convert raw dictionaries to Episode models
-            validated_episodes = []
-            for episode_data in all_episodes_data:
-                try:
-                    # Add series_id if it's missing in the API response
-                    if "series_id" not in episode_data and "seriesId" not in episode_data:
-                        episode_data["seriesId"] = series_id
-
-                    # Ensure episode has a name (required by your model)
-                    if "name" not in episode_data or not episode_data["name"]:
-                        episode_data["name"] = "Untitled Episode"
-
-                    # Create Episode model and validate the data with better error handling
-                    episode = Episode.parse_obj(episode_data)
-                    validated_episodes.append(episode.dict())
-                except Exception as e:
-                    print(f"Error validating episode: {e}")
-                    # For episodes, add a minimally processed version instead of skipping
-                    # This ensures we return something even if validation fails
-                    basic_episode = {
-                        "id": episode_data.get("id", 0),
-                        "seriesId": series_id,
-                        "name": episode_data.get("name", "Untitled"),
-                        "number": episode_data.get("number", episode_data.get("episodeNumber")),
-                        "seasonNumber": episode_data.get("seasonNumber", episode_data.get("season")),
-                        "overview": episode_data.get("overview", ""),
-                        "aired": episode_data.get("aired", episode_data.get("firstAired"))
-                    }
-                    validated_episodes.append(basic_episode)
-
-            # Filter by season if needed
-            if season_number is not None:
-                filtered_episodes = []
-                for episode in validated_episodes:
-                    # Check season number with different possible field names
-                    ep_season = episode.get("season_number", episode.get("seasonNumber"))
-                    if ep_season == season_number or str(ep_season) == str(season_number):
-                        filtered_episodes.append(episode)
-
-                print(f"Filtered to {len(filtered_episodes)} episodes for season {season_number}")
-                return filtered_episodes
-
-            # Return all episodes
-            return validated_episodes
-
-        except Exception as e:
-            print(f"Error in get_series_episodes_by_season: {e}")
-            return []
-
-    def get_series_next_aired(self, series_id: int) -> Dict:
-        """Get information about the next episode to air.
-
-        Args:
-            series_id: The ID of the TV series
-
-        Returns:
-            Next aired episode information
-        """
-        response = self._make_request("GET", f"/series/{series_id}/nextAired")
-        return response.get("data", {})
-
-    def get_series_artworks(self, series_id: int) -> List[Dict]:
-        """Get artworks for a TV series.
-
-        Args:
-            series_id: The ID of the TV series
-
-        Returns:
-            List of artwork items
-        """
-        response = self._make_request("GET", f"/series/{series_id}/artworks")
-        return response.get("data", [])
-
-    def get_series_by_slug(self, slug: str) -> Dict:
-        """Get a TV series by its slug.
-
-        Args:
-            slug: Series slug
-
-        Returns:
-            Series details
-        """
-        response = self._make_request("GET", f"/series/slug/{slug}")
-        return response.get("data", {})
-
-    def get_season_details(self, season_id: int) -> Dict:
-        """Get detailed information about a season.
-
-        Args:
-            season_id: The ID of the season
-
-        Returns:
-            Season details
-        """
-        response = self._make_request("GET", f"/seasons/{season_id}/extended")
-        return response.get("data", {})
-
-    def get_character_details(self, character_id: int) -> Dict:
-        """Get detailed information about a character.
-
-        Args:
-            character_id: The ID of the character
-
-        Returns:
-            Character details
-        """
-        response = self._make_request("GET", f"/characters/{character_id}")
-        return response.get("data", {})
-
-    def get_series_filter(self, filters: Dict[str, Any]) -> List[Dict]:
-        """Search for series using advanced filters.
-
-        Args:
-            filters: Dictionary of filter parameters
-
-        Returns:
-            List of TV series matching the filters
-        """
-        response = self._make_request("GET", "/series/filter", params=filters)
-        return response.get("data", [])
+        self._cache = TTLCache(maxsize=1024, ttl=3600)
+        self._response_cache = TTLCache(maxsize=1024, ttl=DEFAULT_RESPONSE_TTL, stale_ttl=STALE_RESPONSE_TTL)
+        self._inflight = SingleFlight()
+        self._executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="tvdb")
 
-    def advanced_search(
-            self,
-            query: Optional[str] = None,
-            type: Optional[str] = None,
-            year: Optional[int] = None,
-            country: Optional[str] = None,
-            company: Optional[str] = None,
-            language: Optional[str] = None,
-            director: Optional[str] = None,
-            primary_type: Optional[str] = None,
-            network: Optional[str] = None,
-            remote_id: Optional[str] = None,
-            offset: int = 0,
-            limit: int = 5
-    ) -> List[Dict]:
-        """Advanced search for TVDB content with multiple filter options.
-
-        Args:
-            query: The search query string (also accepts 'q' as alias)
-            type: Type of content to search (series, movie, person, company)
-            year: Filter by year (primarily for series/movies)
-            country: Filter by country code (3-letter code)
-            company: Filter by company name (production company, studio, etc.)
-            language: Filter by language code (3-letter code)
-            director: Filter by director name (primarily for movies)
-            primary_type: Filter by company type
-            network: Filter by TV network name
-            remote_id: Search by IMDB or EIDR ID
-            offset: Result offset for pagination
-            limit: Maximum number of results to return
-
-        Returns:
-            List of search results matching the criteria
-        """
-        # Build search parameters
-        params = {}
-
-        # Add query parameter (handles both 'query' and 'q')
-        if query:
-            params["query"] = query
-
-        # Add filter parameters if provided
-        if type:
-            params["type"] = type
-        if year:
-            params["year"] = year
-        if country:
-            params["country"] = country
-        if company:
-            params["company"] = company
-        if language:
-            params["language"] = language
-        if director:
-            params["director"] = director
-        if primary_type:
-            params["primaryType"] = primary_type
-        if network:
-            params["network"] = network
-        if remote_id:
-            params["remote_id"] = remote_id
-
-        # Add pagination parameters
-        params["offset"] = offset
-        params["limit"] = limit
-
-        # Make the request
-        print(f"Performing advanced search with parameters: {params}")
-        try:
-            response = self._make_request("GET", "/search", params=params)
-            results = response.get("data", [])
-            print(f"Found {len(results)} results")
-            return results
-        except TVDBError as e:
-            print(f"Search error: {e}")
-            return []
-
-    def search_movies(
-            self,
-            query: Optional[str] = None,
-            year: Optional[int] = None,
-            director: Optional[str] = None,
-            country: Optional[str] = None,
-            language: Optional[str] = None,
-            limit: int = 5
-    ) -> List[Dict]:
-        """Search for movies with specific filters.
-
-        Args:
-            query: Movie title or keywords
-            year: Release year
-            director: Director name
-            country: Country of origin (3-letter code)
-            language: Primary language (3-letter code)
-            limit: Maximum number of results
-
-        Returns:
-            List of movies matching the criteria
-        """
-        return self.advanced_search(
-            query=query,
-            type="movie",
-            year=year,
-            director=director,
-            country=country,
-            language=language,
-            limit=limit
-        )
-
-    def search_people(
-            self,
-            query: str,
-            limit: int = 5
-    ) -> List[Dict]:
-        """Search for people (actors, directors, etc.).
-
-        Args:
-            query: Person name
-            limit: Maximum number of results
-
-        Returns:
-            List of people matching the criteria
-        """
-        return self.advanced_search(
-            query=query,
-            type="person",
-            limit=limit
-        )
-
-    def search_companies(
-            self,
-            query: Optional[str] = None,
-            primary_type: Optional[str] = None,
-            country: Optional[str] = None,
-            limit: int = 5
-    ) -> List[Dict]:
-        """Search for companies.
-
-        Args:
-            query: Company name
-            primary_type: Type of company (e.g., "Production Company")
-            country: Country code (3-letter)
-            limit: Maximum number of results
-
-        Returns:
-            List of companies matching the criteria
-        """
-        return self.advanced_search(
-            query=query,
-            type="company",
-            primary_type=primary_type,
-            country=country,
-            limit=limit
-        )
-
-    def get_series_awards(self, series_id: int) -> List[Dict]:
-        """Get awards for a TV series.
-
-        Args:
-            series_id: The ID of the TV series
-
-        Returns:
-            List of awards for the series
-        """
-        try:
-            print(f"Fetching awards for series {series_id}")
-
-            # Method 1: Try to get awards from extended series info
-            extended_info = self.get_series_details(series_id)
-            awards = extended_info.get("awards", [])
-
-            if awards:
-                print(f"Found {len(awards)} awards in extended series info")
-                return awards
-
-            # Method 2: Try the direct series awards endpoint
-            print("No awards in extended info, trying direct awards endpoint")
-            endpoint = f"/series/{series_id}/awards"
-            response = self._make_request("GET", endpoint)
-            awards = response.get("data", [])
-
-            if awards:
-                print(f"Found {len(awards)} awards with direct endpoint")
-                return awards
-
-            # Method 3: Try searching all awards for this series
-            print("No awards found with direct endpoint, trying awards search")
-            all_awards = self._make_request("GET", "/awards").get("data", [])
-
-            # Look for awards related to this series
-            series_awards = []
-            for award in all_awards:
-                # Check categories for this series
-                categories = award.get("categories", [])
-                for category in categories:
-                    records = category.get("records", [])
-                    for record in records:
-                        if record.get("seriesId") == series_id:
-                            series_awards.append({
-                                "award_name": award.get("name"),
-                                "category": category.get("name"),
-                                "year": record.get("year"),
-                                "nominee": record.get("nominee"),
-                                "won": record.get("isWinner", False)
-                            })
-
-            print(f"Found {len(series_awards)} awards through search")
-            return series_awards
-
-        except TVDBError as e:
-            print(f"TVDB API Error getting awards: {e}")
-            return []
-        except Exception as e:
-            print(f"Unexpected error getting awards: {str(e)}")
-            return []
-
-    def get_movie_awards(self, movie_id: int) -> List[Dict]:
-        """Get awards for a movie.
-
-        Args:
-            movie_id: The ID of the movie
-
-        Returns:
-            List of awards for the movie
-        """
-        try:
-            print(f"Fetching awards for movie {movie_id}")
-
-            # Method 1: Try to get awards from extended movie info
-            extended_info = self._make_request("GET", f"/movies/{movie_id}/extended").get("data", {})
-            awards = extended_info.get("awards", [])
-
-            if awards:
-                print(f"Found {len(awards)} awards in extended movie info")
-                return awards
-
-            # Method 2: Try the direct movie awards endpoint
-            print("No awards in extended info, trying direct awards endpoint")
-            endpoint = f"/movies/{movie_id}/awards"
-            response = self._make_request("GET", endpoint)
-            awards = response.get("data", [])
-
-            if awards:
-                print(f"Found {len(awards)} awards with direct endpoint")
-                return awards
-
-            # Method 3: Try searching all awards for this movie
-            print("No awards found with direct endpoint, trying awards search")
-            all_awards = self._make_request("GET", "/awards").get("data", [])
-
-            # Look for awards related to this movie
-            movie_awards = []
-            for award in all_awards:
-                # Check categories for this movie
-                categories = award.get("categories", [])
-                for category in categories:
-                    records = category.get("records", [])
-                    for record in records:
-                        if record.get("movieId") == movie_id:
-                            movie_awards.append({
-                                "award_name": award.get("name"),
-                                "category": category.get("name"),
-                                "year": record.get("year"),
-                                "nominee": record.get("nominee"),
-                                "won": record.get("isWinner", False)
-                            })
-
-            print(f"Found {len(movie_awards)} awards through search")
-            return movie_awards
-
-        except TVDBError as e:
-            print(f"TVDB API Error getting movie awards: {e}")
-            return []
-        except Exception as e:
-            print(f"Unexpected error getting movie awards: {str(e)}")
-            return []
-
-    def get_people_awards(self, person_id: int) -> List[Dict]:
-        """Get awards for a person (actor, director, etc.).
-
-        Args:
-            person_id: The ID of the person
-
-        Returns:
-            List of awards for the person
-        """
-        try:
-            print(f"Fetching awards for person {person_id}")
-
-            # Method 1: Try the direct person awards endpoint
-            endpoint = f"/people/{person_id}/awards"
-            response = self._make_request("GET", endpoint)
-            awards = response.get("data", [])
-
-            if awards:
-                print(f"Found {len(awards)} awards with direct endpoint")
-                return awards
-
-            # Method 2: Try searching all awards for this person
-            print("No awards found with direct endpoint, trying awards search")
-            all_awards = self._make_request("GET", "/awards").get("data", [])
-
-            # Look for awards related to this person
-            person_awards = []
-            for award in all_awards:
-                # Check categories for this person
-                categories = award.get("categories", [])
-                for category in categories:
-                    records = category.get("records", [])
-                    for record in records:
-                        if record.get("personId") == person_id:
-                            person_awards.append({
-                                "award_name": award.get("name"),
-                                "category": category.get("name"),
-                                "year": record.get("year"),
-                                "nominee": record.get("nominee"),
-                                "won": record.get("isWinner", False)
-                            })
-
-            print(f"Found {len(person_awards)} awards through search")
-            return person_awards
-
-        except TVDBError as e:
-            print(f"TVDB API Error getting person awards: {e}")
-            return []
-        except Exception as e:
-            print(f"Unexpected error getting person awards: {str(e)}")
-            return []
-
-    def get_award_by_id(self, award_id: int) -> Dict:
-        """Get detailed information about an award by ID.
-
-        Args:
-            award_id: The ID of the award
-
-        Returns:
-            Award details
-        """
-        try:
-            response = self._make_request("GET", f"/awards/{award_id}")
-            return response.get("data", {})
-        except Exception as e:
-            print(f"Error getting award details: {e}")
-            return {}
-
-    def get_award_category(self, category_id: int) -> Dict:
-        """Get detailed information about an award category.
-
-        Args:
-            category_id: The ID of the award category
-
-        Returns:
-            Award category details
-        """
-        try:
-            response = self._make_request("GET", f"/awards/categories/{category_id}")
-            return response.get("data", {})
-        except Exception as e:
-            print(f"Error getting award category details: {e}")
-            return {}
-
-    def get_award_extended(self, award_id: int) -> Dict:
-        """Get extended information about an award by ID.
-
-        Args:
-            award_id: The ID of the award
-
-        Returns:
-            Extended award details including categories
-        """
-        try:
-            response = self._make_request("GET", f"/awards/{award_id}/extended")
-            return response.get("data", {})
-        except Exception as e:
-            print(f"Error getting extended award details: {e}")
-            return {}
-
-    def get_shows_by_network(self, network_name: str, limit: int = 5) -> List[Dict]:
-        """Get shows from a specific network using the correct API parameters.
-
-        Args:
-            network_name: Name of the network (e.g., "HBO")
-            limit: Maximum number of results to return
-
-        Returns:
-            List of shows from the specified network
-        """
-        print(f"Searching for shows on network: {network_name}")
-
-        # Option 1: Try using network parameter in search
-        params = {
-            "network": network_name,
-            "type": "series"
-        }
-
-        try:
-            # First approach: direct network parameter
-            response = self._make_request("GET", "/search", params=params)
-            results = response.get("data", [])
-
-            if results:
-                print(f"Found {len(results)} shows using network parameter search")
-                return self._process_search_results(results)[:limit]
-
-            # Second approach: general search with network name
-            print("No results with network parameter, trying general search")
-
-            params = {
-                "query": network_name,
-                "type": "series"
-            }
-
-            response = self._make_request("GET", "/search", params=params)
-            results = response.get("data", [])
-
-            if results:
-                print(f"Found {len(results)} shows using general search")
-
-                # Filter results to include only those that mention the network
-                network_lower = network_name.lower()
-
-                filtered_results = []
-                for show in results:
-                    # Check if network is mentioned in any of these fields
-                    if (
-                            network_lower in str(show.get("network", "")).lower() or
-                            network_lower in str(show.get("overview", "")).lower() or
-                            network_lower in str(show.get("name", "")).lower()
-                    ):
-                        filtered_results.append(show)
-
-                print(f"Filtered to {len(filtered_results)} shows that mention {network_name}")
-                return self._process_search_results(filtered_results)[:limit]
-
-            # If both approaches fail, return hard-coded popular shows as a fallback
-            if network_name.lower() == "hbo":
-                print("Using fallback HBO shows list")
-                return [
-                    {
-                        "id": "series-82730",
-                        "name": "Game of Thrones",
-                        "network": "HBO",
-                        "overview": "Seven noble families fight for control of the mythical land of Westeros.",
-                        "status": {"name": "Ended"}
-                    },
-                    {
-                        "id": "series-374220",
-                        "name": "Succession",
-                        "network": "HBO",
-                        "overview": "The Roy family controls one of the biggest media and entertainment conglomerates in the world.",
-                        "status": {"name": "Ended"}
-                    },
-                    {
-                        "id": "series-371572",
-                        "name": "House of the Dragon",
-                        "network": "HBO",
-                        "overview": "The story of House Targaryen, 200 years before the events of Game of Thrones.",
-                        "status": {"name": "Continuing"}
-                    }
-                ]
-
-            # No results found
-            return []
-
-        except Exception as e:
-            print(f"Error searching for shows on {network_name}: {str(e)}")
-            # Return a minimal fallback for common networks if API fails
-            if network_name.lower() == "hbo":
-                return [
-                    {"id": "series-82730", "name": "Game of Thrones", "network": "HBO"},
-                    {"id": "series-374220", "name": "Succession", "network": "HBO"},
-                    {"id": "series-371572", "name": "House of the Dragon", "network": "HBO"}
-                ]
-            return []
-
-    def _process_search_results(self, results: List[Dict]) -> List[Dict]:
-        """Process and normalize search results into a consistent format.
-
-        Args:
-            results: Raw results from the TVDB API
-
-        Returns:
-            Processed and normalized results
-        """
-        processed_results = []
-
-        for result in results:
-            try:
-                # Extract key information - handle different possible formats
-                series_info = {
-                    "id": result.get("id", result.get("tvdb_id")),
-                    "name": result.get("name", result.get("title", "")),
-                    "overview": result.get("overview", ""),
-                    "year": result.get("year", ""),
-                    "status": result.get("status", ""),
-                    "network": result.get("network", ""),
-                    "genres": result.get("genres", []),
-                    "image_url": result.get("image_url", result.get("poster", result.get("thumbnail", ""))),
-                }
-
-                # Normalize status field
-                if isinstance(series_info["status"], str):
-                    series_info["status"] = {"id": 0, "name": series_info["status"]}
-
-                processed_results.append(series_info)
-
-            except Exception as e:
-                print(f"Error processing result: {str(e)}")
-                # Add the original item as fallback
-                processed_results.append(result)
-
-        return processed_results
-
-    def get_movie_details(self, movie_id: int) -> Dict:
-        """Get detailed information about a movie.
-
-        Args:
-            movie_id: The ID of the movie
-
-        Returns:
-            Movie details
-        """
-        try:
-            response = self._make_request("GET", f"/movies/{movie_id}/extended")
-            return response.get("data", {})
-        except Exception as e:
-            print(f"Error getting movie details: {e}")
-            return {}
-
-    def get_movie_cast(self, movie_id: int) -> List[Dict]:
-        """Get the cast of a movie.
-
-        Args:
-            movie_id: The ID of the movie
-
-        Returns:
-            List of cast members
-        """
-        try:
-            # Try to get cast from extended info first
-            extended_info = self.get_movie_details(movie_id)
-            cast = extended_info.get("characters", [])
-
-            if cast:
-                return cast
-
-            # If not found in extended info, try direct endpoint
-            response = self._make_request("GET", f"/movies/{movie_id}/cast")
-            return response.get("data", [])
-        except Exception as e:
-            print(f"Error getting movie cast: {e}")
-            return []
-
-    def get_similar_movies(self, movie_id: int, limit: int = 5) -> List[Dict]:
-        """Get similar movies recommendations.
-
-        Args:
-            movie_id: The ID of the movie
-            limit: Maximum number of recommendations to return
-
-        Returns:
-            List of similar movies
-        """
-        try:
-            # Get the movie details to extract genres
-            movie_details = self.get_movie_details(movie_id)
-
-            # Get the genres of the movie
-            genres = [genre.get("name") for genre in movie_details.get("genres", [])]
-
-            if not genres:
-                return []
-
-            # Use the first genre to search for similar movies
-            primary_genre = genres[0]
-            search_results = self.search_movies(query=primary_genre, limit=limit + 1)
-
-            # Filter out the original movie
-            similar_movies = [
-                movie for movie in search_results
-                if str(movie.get("id")) != str(movie_id)
-            ]
-
-            return similar_movies[:limit]
-        except Exception as e:
-            print(f"Error getting similar movies: {e}")
-            return []
-
-    def get_movies_by_director(self, director_name: str, limit: int = 5) -> List[Dict]:
-        """Get movies by a specific director.
-
-        Args:
-            director_name: Name of the director
-            limit: Maximum number of results to return
-
-        Returns:
-            List of movies by the director
-        """
-        return self.search_movies(
-            query=None,
-            director=director_name,
-            limit=limit
-        )
-
-    def get_movie_translations(self, movie_id: int, language: Optional[str] = None) -> Dict:
-        """Get translations for a movie.
-
-        Args:
-            movie_id: The ID of the movie
-            language: Optional language code to filter (3-letter code)
-
-        Returns:
-            Movie translations
-        """
-        try:
-            endpoint = f"/movies/{movie_id}/translations"
-            if language:
-                endpoint += f"/{language}"
-
-            response = self._make_request("GET", endpoint)
-            return response.get("data", {})
-        except Exception as e:
-            print(f"Error getting movie translations: {e}")
-            return {}
-
-    def get_movie_filter(self, filters: Dict[str, Any]) -> List[Dict]:
-        """Search for movies using advanced filters.
-
-        Args:
-            filters: Dictionary of filter parameters
-
-        Returns:
-            List of movies matching the filters
-        """
-        # Make sure to set type to movie
-        filters["type"] = "movie"
-        response = self._make_request("GET", "/movies/filter", params=filters)
-        return response.get("data", [])
-
-    def get_movie_artworks(self, movie_id: int) -> List[Dict]:
-        """Get artworks for a movie.
-
-        Args:
-            movie_id: The ID of the movie
-
-        Returns:
-            List of artwork items
-        """
-        try:
-            response = self._make_request("GET", f"/movies/{movie_id}/artworks")
-            return response.get("data", [])
-        except Exception as e:
-            print(f"Error getting movie artworks: {e}")
-            return []
-
-    def get_trending_movies(self, limit: int = 5) -> List[Dict]:
-        """Get trending or popular movies with improved fallback handling.
-
-        Args:
-            limit: Maximum number of movies to return
-
-        Returns:
-            List of trending movies
-        """
-        try:
-            print("Attempting to fetch trending movies from TVDB API")
-
-            # Try the trending endpoint if available
-            try:
-                response = self._make_request("GET", "/movies/trending")
-                trending = response.get("data", [])
-
-                if trending:
-                    print(f"Successfully retrieved {len(trending)} trending movies")
-                    return trending[:limit]
-            except TVDBError as e:
-                print(f"Error using trending endpoint: {e}")
-                trending = []
-
-            # Fallback 1: Use filter with sort by score (popularity)
-            print("No trending movies found, trying filter by score")
-            try:
-                filters = {
-                    "sort": "score",
-                    "type": "movie",
-                    "limit": limit
-                }
-
-                response = self._make_request("GET", "/movies/filter", params=filters)
-                filtered = response.get("data", [])
-
-                if filtered:
-                    print(f"Found {len(filtered)} movies using score filter")
-                    return filtered[:limit]
-            except TVDBError as e:
-                print(f"Error using filter endpoint: {e}")
-                filtered = []
-
-            # Fallback 2: Search for recent or popular movies
-            print("Trying general search for recent or popular movies")
-            try:
-                # Search for popular movies
-                popular_results = self.search_movies(query="popular", limit=limit)
-                if popular_results:
-                    print(f"Found {len(popular_results)} popular movies via search")
-                    return popular_results
-
-                # Try another search term
-                recent_results = self.search_movies(query="2023", limit=limit)
-                if recent_results:
-                    print(f"Found {len(recent_results)} recent movies via search")
-                    return recent_results
-            except Exception as e:
-                print(f"Error in fallback searches: {e}")
-
-            # Fallback 3: Last resort - search for any movies
-            print("Last resort: searching for any movies")
-            try:
-                basic_results = self.search_movies(query="movie", limit=limit)
-                if basic_results:
-                    print(f"Found {len(basic_results)} basic movie results")
-                    return basic_results
-            except Exception as e:
-                print(f"Error in basic movie search: {e}")
-
-            # If all else fails
-            return []
-
-        except Exception as e:
-            print(f"Error getting trending movies: {str(e)}")
-            return []
-
-    def recommend_movies(self, criteria: Dict[str, Any], limit: int = 5) -> List[Dict]:
-        """Recommend movies based on multiple criteria with improved handling.
-
-        Args:
-            criteria: Dictionary containing criteria such as genres, actors, directors
-            limit: Maximum number of recommendations
-
-        Returns:
-            List of recommended movies
-        """
-        print(f"Recommending movies with criteria: {criteria}")
-        results = []
-
-        # Try to find by genre first
-        if "genres" in criteria and criteria["genres"]:
-            print(f"Searching by genres: {criteria['genres']}")
-            for genre in criteria["genres"][:2]:  # Use top 2 genres
-                try:
-                    genre_results = self.get_movies_by_genre(genre, limit=3)
-                    if genre_results:
-                        print(f"Found {len(genre_results)} movies for genre '{genre}'")
-                        results.extend(genre_results)
-                    else:
-                        print(f"No results for genre '{genre}'")
-                except Exception as e:
-                    print(f"Error searching for genre '{genre}': {e}")
-
-        # Try to find by director
-        if "directors" in criteria and criteria["directors"]:
-            print(f"Searching by directors: {criteria['directors']}")
-            for director in criteria["directors"][:2]:  # Use top 2 directors
-                try:
-                    director_results = self.get_movies_by_director(director, limit=3)
-                    if director_results:
-                        print(f"Found {len(director_results)} movies by director '{director}'")
-                        results.extend(director_results)
-                    else:
-                        print(f"No results for director '{director}'")
-                except Exception as e:
-                    print(f"Error searching for director '{director}': {e}")
-
-        # Try to find by actor (using advanced search)
-        if "actors" in criteria and criteria["actors"]:
-            print(f"Searching by actors: {criteria['actors']}")
-            for actor in criteria["actors"][:2]:  # Use top 2 actors
-                try:
-                    # Find the actor first
-                    actor_search = self.search_people(actor, limit=1)
-                    if actor_search:
-                        actor_id = actor_search[0].get("id")
-                        if actor_id:
-                            print(f"Found actor ID {actor_id} for '{actor}'")
-                            # Now search for movies with this actor
-                            # This would need a specific endpoint which might not be available
-                            # For now, use general search with actor name
-                            actor_results = self.search_movies(query=actor, limit=3)
-                            if actor_results:
-                                print(f"Found {len(actor_results)} movies with actor '{actor}'")
-                                results.extend(actor_results)
-                            else:
-                                print(f"No movie results for actor '{actor}'")
-                    else:
-                        print(f"Actor '{actor}' not found")
-                except Exception as e:
-                    print(f"Error searching for actor '{actor}': {e}")
-
-        # If no results found, try a fallback
-        if not results:
-            print("No results found with provided criteria, trying fallbacks")
-
-            # Try trending movies
-            try:
-                trending = self.get_trending_movies(limit=limit)
-                if trending:
-                    print(f"Using {len(trending)} trending movies as fallback")
-                    return trending
-            except Exception as e:
-                print(f"Error getting trending movies fallback: {e}")
-
-            # Last resort - basic search
-            try:
-                fallback = self.search_movies(query="movie", limit=limit)
-                if fallback:
-                    print(f"Using {len(fallback)} basic movie results as fallback")
-                    return fallback
-            except Exception as e:
-                print(f"Error in basic fallback search: {e}")
-
-            return []
-
-        # Remove duplicates by id
-        unique_results = []
-        seen_ids = set()
-
-        for movie in results:
-            movie_id = movie.get("id")
-            if movie_id and movie_id not in seen_ids:
-                seen_ids.add(movie_id)
-                unique_results.append(movie)
-
-        print(f"Returning {len(unique_results[:limit])} unique movie recommendations")
-        return unique_results[:limit]
-
-    def get_movies_by_genre(self, genre: str, limit: int = 5) -> List[Dict]:
-        """Get movies by genre with improved reliability.
-
-        Args:
-            genre: Genre name
-            limit: Maximum number of results to return
-
-        Returns:
-            List of movies in the specified genre
-        """
-        print(f"Searching for movies with genre: {genre}")
-
-        try:
-            # First approach: direct search using genre as query
-            results = self.search_movies(query=genre, limit=limit)
-
-            if results:
-                print(f"Found {len(results)} movies for genre '{genre}' via direct search")
-                return results
-
-            # Second approach: try advanced search with type=movie
-            advanced_results = self.advanced_search(
-                query=genre,
-                type="movie",
-                limit=limit
-            )
-
-            if advanced_results:
-                print(f"Found {len(advanced_results)} movies for genre '{genre}' via advanced search")
-                return advanced_results
-
-            # If both fail, return empty list
-            print(f"No results found for genre '{genre}'")
-            return []
-
-        except Exception as e:
-            print(f"Error searching for movies in genre '{genre}': {e}")
-            return []
-            """TVDB API client implementation."""
-
-
-import os
-import time
-from typing import Dict, List, Optional, Any
-from app.tvdb.models import Episode, Series, SearchResult, SeriesBase
-
-import requests
-from dotenv import load_dotenv
-
-# Load environment variables from .env file
-load_dotenv()
-
-# TVDB API Configuration
-TVDB_API_URL = "https://api4.thetvdb.com/v4"
-TVDB_API_KEY = os.getenv("TVDB_API_KEY")
-TVDB_PIN = os.getenv("TVDB_PIN")
-
-
-class TVDBError(Exception):
-    """Exception raised for TVDB API errors."""
-
-    def __init__(self, status_code: int, message: str):
-        self.status_code = status_code
-        self.message = message
-        super().__init__(f"TVDB API Error ({status_code}): {message}")
-
-
-class TVDBClient:
-    """Client for interacting with the TVDB API."""
+    def close(self):
+        """Release the client's worker threads and pooled connections."""
+        self._executor.shutdown(wait=False)
+        self._session.close()
 
-    def __init__(self):
-        self.api_url = TVDB_API_URL
-        self.api_key = TVDB_API_KEY
-        self.pin = TVDB_PIN
-        self.token = None
-        self.token_expires = 0
-        self.headers = {"Content-Type": "application/json"}
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
 
     def _ensure_token(self):
         """Ensure a valid token is available for API requests."""
-        current_time = time.time()
+        # Refresh a little before the token actually expires so no request is
+        # sent with a stale token and bounced with a 401
+        if self.token and time.time() < self.token_expires - TOKEN_REFRESH_MARGIN:
+            return
+
+        with self._token_lock:
+            # Another thread may have logged in while we waited for the lock
+            if self.token and time.time() < self.token_expires - TOKEN_REFRESH_MARGIN:
+                return
+
+            # A fresh process can reuse the token saved by an earlier one
+            if not self.token and self._load_cached_token():
+                return
 
-        # If token is expired or not set, get a new one
-        if not self.token or current_time >= self.token_expires:
             self._login()
 
+    def _token_cache_path(self) -> Optional[str]:
+        """Path of the on-disk token cache for this API key, if there is a key."""
+        if not self.api_key:
+            return None
+        key_hash = hashlib.sha1(self.api_key.encode()).hexdigest()
+        return os.path.join(TOKEN_CACHE_DIR, f"tvdb_token_{key_hash}.json")
+
+    def _load_cached_token(self) -> bool:
+        """Load a still-valid token saved by a previous process.
+
+        Returns:
+            True if a usable token was loaded
+        """
+        path = self._token_cache_path()
+        if not path:
+            return False
+
+        try:
+            with open(path, "rb") as f:
+                cached_token = json_loads(f.read())
+            token = cached_token["token"]
+            token_expires = float(cached_token["token_expires"])
+        except (OSError, ValueError, KeyError, TypeError):
+            return False
+
+        if time.time() >= token_expires - TOKEN_REFRESH_MARGIN:
+            return False
+
+        self._set_token(token, token_expires)
+        return True
+
+    def _save_cached_token(self):
+        """Save the current token so later processes can skip the login call."""
+        path = self._token_cache_path()
+        if not path:
+            return
+
+        # Write to a private temp file and rename it into place so other workers
+        # never read a half-written token
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(TOKEN_CACHE_DIR, exist_ok=True)
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "wb") as f:
+                f.write(json_dumps({"token": self.token, "token_expires": self.token_expires}))
+            os.replace(tmp_path, path)
+        except OSError:
+            # The cache is only an optimization; a read-only home directory is fine
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
+    def _clear_cached_token(self, rejected_token: Optional[str] = None):
+        """Forget the current token, in memory and on disk.
+
+        Args:
+            rejected_token: The token a request was refused with; if another thread
+                has already replaced it, the new token is kept
+        """
+        with self._token_lock:
+            if rejected_token is not None:
+                if self.token != rejected_token:
+                    return
+                # Tokens are refreshed ahead of expiry, so this should be rare;
+                # frequent hits mean the token is being revoked early
+                logger.info("TVDB rejected the current token; logging in again")
+
+            self.token = None
+            path = self._token_cache_path()
+            if path:
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+
+    def _set_token(self, token: str, token_expires: float):
+        """Install an access token on the client and its session."""
+        self.token = token
+        self.token_expires = token_expires
+        self.headers["Authorization"] = f"Bearer {self.token}"
+        self._session.headers.update(self.headers)
+
     def _login(self):
         """Authenticate with the TVDB API and get an access token."""
         login_url = f"{self.api_url}/login"
@@ -1356,7 +332,8 @@ class TVDBClient:
         if self.pin:
             payload["pin"] = self.pin
 
-        response = requests.post(login_url, json=payload)
+        # The session already sends Content-Type: application/json
+        response = self._session.post(login_url, data=json_dumps(payload), timeout=REQUEST_TIMEOUT)
 
         if response.status_code != 200:
             raise TVDBError(
@@ -1364,46 +341,148 @@ class TVDBClient:
                 f"Authentication failed: {response.text}"
             )
 
-        data = response.json()
-        self.token = data["data"]["token"]
+        data = json_loads(response.content)
         # Token expires in 1 month, but we'll set it to expire in 29 days to be safe
-        self.token_expires = time.time() + (29 * 24 * 60 * 60)
-        self.headers["Authorization"] = f"Bearer {self.token}"
+        self._set_token(data["data"]["token"], time.time() + (29 * 24 * 60 * 60))
+        self._save_cached_token()
 
     def _make_request(
+            self,
+            method: str,
+            endpoint: str,
+            params: Optional[Dict] = None,
+            data: Optional[Dict] = None,
+            fields: Optional[Iterable[str]] = None
+    ) -> Dict:
+        """Make a request to the TVDB API, serving repeated GETs from the response cache.
+
+        Args:
+            method: HTTP method
+            endpoint: API path, e.g. "/series/81189/extended"
+            params: Optional query parameters
+            data: Optional JSON body
+            fields: Optional top-level keys of the response's "data" object to keep
+
+        Returns:
+            The decoded JSON response
+        """
+        response = self._cached_request(method, endpoint, params, data)
+        if fields is not None and isinstance(response.get("data"), dict):
+            # Trim before copying so only the requested keys are duplicated
+            record = response["data"]
+            response = {**response, "data": {key: record[key] for key in fields if key in record}}
+
+        # The response may be the cached object itself; callers get their own copy
+        return copy.deepcopy(response)
+
+    def _cached_request(
             self,
             method: str,
             endpoint: str,
             params: Optional[Dict] = None,
             data: Optional[Dict] = None
     ) -> Dict:
-        """Make a request to the TVDB API."""
-        self._ensure_token()
+        """Send a request, serving repeated GETs from the response cache.
 
-        url = f"{self.api_url}{endpoint}"
+        The returned response may be shared with the cache and other callers,
+        so it must not be modified; _make_request hands out copies.
+        """
+        if method != "GET" or data is not None:
+            return self._send_request(method, endpoint, params, data)
 
+        cache_key = (endpoint, tuple(sorted((params or {}).items())))
         try:
-            response = requests.request(
-                method,
-                url,
-                headers=self.headers,
-                params=params,
-                json=data
-            )
+            hash(cache_key)
+        except TypeError:
+            # Parameters with list/dict values can't key the cache
+            return self._send_request(method, endpoint, params, data)
+
+        entry = self._response_cache.get(cache_key)
+        if entry is not None:
+            return entry[0]
+
+        def load():
+            # An expired copy still lets us ask the server whether it changed
+            stale = self._response_cache.get_stale(cache_key)
+            etag = stale[1] if stale is not None else None
+            try:
+                response, new_etag = self._send_conditional(method, endpoint, params, data, etag=etag)
+            except TVDBError as e:
+                # During an outage an older copy beats an error
+                if e.status_code >= 500 and stale is not None:
+                    logger.warning("Serving stale TVDB response for %s: %s", endpoint, e)
+                    return stale[0]
+                raise
 
-            if response.status_code == 401:
-                # Token might be expired, try to get a new one
-                self.token = None
-                self._ensure_token()
+            if response is None:
+                # 304 Not Modified: the stale copy is current again
+                response, new_etag = stale
+
+            self._response_cache.set(cache_key, (response, new_etag), ttl=_response_ttl(endpoint))
+            return response
+
+        return self._inflight.do(("response", cache_key), load)
+
+    def _send_request(
+            self,
+            method: str,
+            endpoint: str,
+            params: Optional[Dict] = None,
+            data: Optional[Dict] = None
+    ) -> Dict:
+        """Send a request to the TVDB API."""
+        return self._send_conditional(method, endpoint, params, data)[0]
+
+    def _send_conditional(
+            self,
+            method: str,
+            endpoint: str,
+            params: Optional[Dict] = None,
+            data: Optional[Dict] = None,
+            etag: Optional[str] = None
+    ) -> Tuple[Optional[Dict], Optional[str]]:
+        """Send a request to the TVDB API, revalidating a cached copy if an ETag is given.
 
-                # Retry the request
-                response = requests.request(
+        Args:
+            method: HTTP method
+            endpoint: API path
+            params: Optional query parameters
+            data: Optional JSON body
+            etag: ETag of a cached copy to send as If-None-Match
+
+        Returns:
+            Tuple of (decoded response, response ETag); the response is None
+            when the server answered 304 Not Modified
+        """
+        self._ensure_token()
+
+        url = self.api_url + endpoint
+        headers = {"If-None-Match": etag} if etag else None
+
+        try:
+            # Transient failures are retried by the session adapter; a 401 gets
+            # exactly one more attempt with a fresh token
+            for attempt in range(2):
+                sent_token = self.token
+                response = self._session.request(
                     method,
                     url,
-                    headers=self.headers,
                     params=params,
-                    json=data
+                    json=data,
+                    headers=headers,
+                    timeout=REQUEST_TIMEOUT
                 )
+                if response.status_code != 401 or attempt:
+                    break
+
+                # Token might be expired, try to get a new one; drop the saved
+                # copy too so a revoked token isn't reloaded from disk. Threads
+                # that raced on the same stale token share a single re-login.
+                self._clear_cached_token(sent_token)
+                self._ensure_token()
+
+            if response.status_code == 304 and etag:
+                return None, etag
 
             if response.status_code != 200:
                 raise TVDBError(
@@ -1411,10 +490,98 @@ class TVDBClient:
                     f"API request failed: {response.text}"
                 )
 
-            return response.json()
+            return json_loads(response.content), response.headers.get("ETag")
+
+        except requests.exceptions.RequestException as e:
+            raise TVDBError(500, f"Request failed: {str(e)}")
+        except JSONDecodeError as e:
+            raise TVDBError(500, f"Invalid JSON response: {str(e)}")
+
+    def _stream_items(
+            self,
+            endpoint: str,
+            prefix: str = "data.item",
+            params: Optional[Dict] = None
+    ) -> Iterator[Any]:
+        """Stream the items of a large JSON response instead of loading it whole.
+
+        Args:
+            endpoint: API path to GET
+            prefix: ijson path of the items to yield
+            params: Optional query parameters
+
+        Returns:
+            Iterator over the decoded items
+        """
+        self._ensure_token()
+        url = self.api_url + endpoint
+
+        try:
+            for attempt in range(2):
+                sent_token = self.token
+                response = self._session.get(url, params=params, stream=True, timeout=REQUEST_TIMEOUT)
+                if response.status_code != 401 or attempt:
+                    break
+
+                response.close()
+                self._clear_cached_token(sent_token)
+                self._ensure_token()
+
+            with response:
+                if response.status_code != 200:
+                    raise TVDBError(
+                        response.status_code,
+                        f"API request failed: {response.text}"
+                    )
+
+                # Let urllib3 undo any gzip encoding before ijson sees the bytes
+                response.raw.decode_content = True
+                yield from ijson.items(response.raw, prefix, use_float=True)
 
         except requests.exceptions.RequestException as e:
             raise TVDBError(500, f"Request failed: {str(e)}")
+        except ijson.JSONError as e:
+            raise TVDBError(500, f"Invalid JSON response: {str(e)}")
+
+    def _make_request_async(
+            self,
+            method: str,
+            endpoint: str,
+            params: Optional[Dict] = None,
+            data: Optional[Dict] = None
+    ) -> Future:
+        """Start a request on the client's worker pool.
+
+        Returns:
+            Future resolving to the decoded JSON response
+        """
+        return self._executor.submit(self._make_request, method, endpoint, params, data)
+
+    def batch_get(
+            self,
+            endpoints: List[Tuple[str, Optional[Dict]]],
+            ignore_errors: bool = False
+    ) -> List[Dict]:
+        """Issue several independent GET requests concurrently.
+
+        Args:
+            endpoints: List of (endpoint, params) pairs
+            ignore_errors: Return an empty dict for failed requests instead of raising
+
+        Returns:
+            Responses in the same order as endpoints
+        """
+        futures = [self._make_request_async("GET", endpoint, params) for endpoint, params in endpoints]
+
+        responses = []
+        for future in futures:
+            try:
+                responses.append(future.result())
+            except TVDBError:
+                if not ignore_errors:
+                    raise
+                responses.append({})
+        return responses
 
     def search_series(
             self,
@@ -1426,7 +593,25 @@ class TVDBClient:
             status: Optional[str] = None,
             genre: Optional[str] = None
     ) -> List[Dict]:
-        """Search for TV series by name."""
+        """Search for TV series by name; API errors are logged and yield no results."""
+        try:
+            return self._search_series(query, limit, year, country, network, status, genre)
+        except Exception as e:
+            logger.warning("Search error: %s", e)
+            return []
+
+    @cached(ttl=_response_ttl("/search"), key=_search_series_key)
+    def _search_series(
+            self,
+            query: str,
+            limit: int = 5,
+            year: Optional[int] = None,
+            country: Optional[str] = None,
+            network: Optional[str] = None,
+            status: Optional[str] = None,
+            genre: Optional[str] = None
+    ) -> List[Dict]:
+        """Search for TV series by name, raising on API errors so they are never cached."""
         # Build search parameters according to API documentation
         params = {
             "query": query,  # Use the correct 'query' parameter as shown in the docs
@@ -1441,139 +626,199 @@ class TVDBClient:
         if network:
             params["network"] = network
 
-        # Print request details for debugging
-        print(f"Searching for series with params: {params}")
-        print(f"Full URL: {self.api_url}/search with headers: {self.headers}")
+        # Let the API trim the result set; status and genre can only be
+        # filtered here, so ask for extra rows to filter from in that case
+        params["limit"] = limit * SEARCH_OVERFETCH_FACTOR if (status or genre) else limit
 
-        try:
-            response = self._make_request("GET", "/search", params=params)
+        logger.debug("Searching for series with params: %s", params)
 
-            # Print raw response for debugging
-            print(f"Response status: {response.get('status', 'No status')}")
-            print(f"Response data count: {len(response.get('data', []))}")
+        response = self._make_request("GET", "/search", params=params)
 
-            results = response.get("data", [])
+        results = response.get("data", [])
 
-            if not results:
-                print(f"No results found for query: '{query}'")
-                return []
+        if not results:
+            logger.debug("No results found for query: '%s'", query)
+            return []
 
-            print(f"Found {len(results)} results for '{query}'")
+        logger.debug("Found %s results for '%s'", len(results), query)
 
-            # Format and validate results
-            validated_results = []
-            for result in results:
-                try:
-                    # Extract key information - handle different possible formats
-                    series_info = {
-                        "id": result.get("id", result.get("tvdb_id")),
-                        "name": result.get("name", result.get("title", "")),
-                        "overview": result.get("overview", ""),
-                        "year": result.get("year", ""),
-                        "status": result.get("status", ""),
-                        "network": result.get("network", ""),
-                        "genre": result.get("genres", []),
-                        "image_url": result.get("image_url", result.get("poster", result.get("thumbnail", ""))),
-                    }
+        # Format and validate results; without a post-filter only the
+        # first `limit` rows can be returned, so skip normalizing the rest
+        rows = results if (status or genre) else islice(results, limit)
+        validated_results = [_normalize_series(result) for result in rows]
 
-                    # Apply custom transformations if needed
-                    if isinstance(series_info["status"], str):
-                        series_info["status"] = {"id": 0, "name": series_info["status"]}
+        logger.debug("Processed %s valid results", len(validated_results))
 
-                    # Add to results
-                    validated_results.append(series_info)
+        # Apply additional filtering if needed, case-folding the filters once
+        if status or genre:
+            want_status = status.casefold() if status else None
+            want_genre = genre.casefold() if genre else None
+            matching = (
+                series for series in validated_results
+                if self._series_matches(series, want_status, want_genre)
+            )
+            validated_results = list(islice(matching, limit))
+            logger.debug("After filtering: %s results", len(validated_results))
 
-                except Exception as e:
-                    print(f"Error processing result: {str(e)}")
-                    # Add the original item as fallback
-                    validated_results.append(result)
-
-            print(f"Processed {len(validated_results)} valid results")
-
-            # Apply additional filtering if needed
-            if status or genre:
-                filtered_results = []
-                for series in validated_results:
-                    if status and isinstance(series.get("status"), dict):
-                        if status.lower() not in series["status"].get("name", "").lower():
-                            continue
-                    elif status and isinstance(series.get("status"), str):
-                        if status.lower() not in series["status"].lower():
-                            continue
-
-                    if genre and series.get("genre"):
-                        genre_match = False
-                        for g in series["genre"]:
-                            if isinstance(g, str) and genre.lower() in g.lower():
-                                genre_match = True
-                                break
-                            elif isinstance(g, dict) and genre.lower() in g.get("name", "").lower():
-                                genre_match = True
-                                break
-                        if not genre_match:
-                            continue
-
-                    filtered_results.append(series)
-
-                validated_results = filtered_results
-                print(f"After filtering: {len(validated_results)} results")
-
-            # Return limited results
-            return validated_results[:limit]
+        # Return limited results
+        return validated_results[:limit]
 
-        except Exception as e:
-            print(f"Search error: {str(e)}")
-            return []
+    @staticmethod
+    def _series_matches(series: Dict, want_status: Optional[str], want_genre: Optional[str]) -> bool:
+        """Check a search result against case-folded status and genre filters.
 
-    def get_series_details(self, series_id: int) -> Dict:
+        Args:
+            series: Normalized search result
+            want_status: Case-folded status substring to require, if any
+            want_genre: Case-folded genre substring to require, if any
+
+        Returns:
+            True if the series passes every filter given
+        """
+        if want_status:
+            series_status = series.get("status")
+            if isinstance(series_status, dict):
+                series_status = series_status.get("name", "")
+            if isinstance(series_status, str) and want_status not in series_status.casefold():
+                return False
+
+        if want_genre and series.get("genre"):
+            for g in series["genre"]:
+                name = g.get("name", "") if isinstance(g, dict) else g
+                if isinstance(name, str) and want_genre in name.casefold():
+                    break
+            else:
+                return False
+
+        return True
+
+    @cached(ttl=_response_ttl("/search"), key=lambda name: name.casefold())
+    def resolve_series_name(self, name: str) -> Optional[int]:
+        """Look up the numeric ID of the best search match for a series name.
+
+        Args:
+            name: Series name to search for
+
+        Returns:
+            The numeric series ID, or None if no series matches
+
+        Raises:
+            TVDBError: If the search fails, so an outage isn't cached as a miss
+        """
+        results = self._search_series(name, limit=1)
+        if results:
+            match = SERIES_ID_RE.match(str(results[0].get("id") or ""))
+            if match:
+                return int(match.group(1))
+        return None
+
+    def get_series_details(self, series_id: int, fields: Optional[Tuple[str, ...]] = None) -> Dict:
         """Get detailed information about a TV series.
 
         Args:
             series_id: The ID of the TV series
+            fields: Optional top-level keys to keep; all keys are returned if omitted
 
         Returns:
             Details about the TV series
         """
-        response = self._make_request("GET", f"/series/{series_id}/extended")
+        # The response cache holds the extended record once; only the
+        # requested keys are copied out of it
+        response = self._make_request("GET", f"/series/{series_id}/extended", fields=fields)
         return response.get("data", {})
 
+    def get_series_details_batch(self, series_ids: List[int]) -> Dict[int, Dict]:
+        """Get detailed information about several TV series in parallel.
+
+        Args:
+            series_ids: IDs of the TV series
+
+        Returns:
+            Mapping of series ID to its details; series that fail to load map to {}
+        """
+        def load(series_id: int) -> Dict:
+            try:
+                return self.get_series_details(series_id)
+            except TVDBError as e:
+                logger.warning("Error getting details for series %s: %s", series_id, e)
+                return {}
+
+        unique_ids = list(dict.fromkeys(series_ids))
+        return dict(zip(unique_ids, self._executor.map(load, unique_ids)))
+
     def get_series_cast(self, series_id: int) -> List[Dict]:
         """Get the cast of a TV series."""
-        response = self._make_request("GET", f"/series/{series_id}/extended")
-        return response.get("data", {}).get("characters", [])
+        # The cast is part of the extended record, so share its cache entry
+        return self.get_series_details(series_id, fields=("characters",)).get("characters", [])
+
+    def get_similar_series(self, series_id: int, series_details: Optional[Dict] = None) -> List[Dict]:
+        """Get similar TV series recommendations based on genres.
 
-    def get_similar_series(self, series_id: int) -> List[Dict]:
-        """Get similar TV series recommendations based on genres."""
-        series_details = self.get_series_details(series_id)
+        Args:
+            series_id: The ID of the TV series
+            series_details: Details the caller already has; only "genres" is read.
+                Fetched when omitted.
+
+        Returns:
+            Up to 5 similar series
+        """
+        if series_details is None:
+            series_details = self.get_series_details(series_id, fields=("genres",))
 
-        # Get the genres of the series
-        genres = [genre.get("name") for genre in series_details.get("genres", [])]
+        # Get the genres of the series; search results list them as plain names
+        genres = [
+            genre.get("name") if isinstance(genre, dict) else genre
+            for genre in series_details.get("genres") or []
+        ]
+        genres = tuple(genre for genre in genres if genre)
 
         if not genres:
             return []
 
-        # Use the first genre to search for similar shows
-        primary_genre = genres[0]
-        search_results = self.search_series(primary_genre, limit=10)
+        return self._similar_for_genres(series_id, genres[:3])
 
-        # Filter out the original series
-        similar_series = [
-            series for series in search_results
-            if series.get("id") != series_id
-        ]
+    @cached(ttl=_response_ttl("/search"))
+    def _similar_for_genres(self, series_id: int, genres: Tuple[str, ...]) -> List[Dict]:
+        """Merge the search results of a series' top genres, keyed on the genres used.
+
+        Args:
+            series_id: The ID of the TV series to leave out of the results
+            genres: Genre names to search, primary genre first
+
+        Returns:
+            Up to 5 similar series
+        """
+        # Search the genres concurrently and merge the candidates,
+        # keeping the order of the primary genre's results first
+        results_per_genre = self._executor.map(
+            lambda genre: self.search_series(genre, limit=10),
+            genres
+        )
+
+        # Filter out the original series and de-duplicate by id
+        exclude = {series_id, str(series_id), f"series-{series_id}"}
+        similar_series = {}
+        for search_results in results_per_genre:
+            for series in search_results:
+                candidate_id = series.get("id")
+                if candidate_id not in exclude and candidate_id not in similar_series:
+                    similar_series[candidate_id] = series
 
-        return similar_series[:5]  # Return up to 5 similar series
+        return list(similar_series.values())[:5]  # Return up to 5 similar series
 
+    @cached(ttl=_response_ttl("/series"))
     def get_series_by_network(self, network: str, limit: int = 5) -> List[Dict]:
         """Get TV series by network."""
-        # First, find the network ID
-        networks = self._make_request("GET", "/networks").get("data", [])
-        network_id = None
-
-        for n in networks:
-            if network.lower() in n.get("name", "").lower():
-                network_id = n.get("id")
-                break
+        # First, find the network ID: exact name match, else the first partial match
+        network_ids = self._network_ids()
+        network_key = network.casefold()
+        network_id = network_ids.get(network_key)
+
+        if network_id is None:
+            network_id = next(
+                (nid for name, nid in network_ids.items() if network_key in name),
+                None
+            )
 
         if not network_id:
             return []
@@ -1587,73 +832,93 @@ class TVDBClient:
         response = self._make_request("GET", "/series", params=params)
         return response.get("data", [])
 
+    @cached(ttl=24 * 60 * 60)
+    def _network_ids(self) -> Dict[str, int]:
+        """Map case-folded network names to IDs; networks rarely change, so keep it a day."""
+        networks = self._make_request("GET", "/networks").get("data", [])
+        network_ids = {}
+        for n in networks:
+            # Keep the first ID for a name, matching the order of the API listing
+            network_ids.setdefault(n.get("name", "").casefold(), n.get("id"))
+        return network_ids
+
     # Add these methods to your TVDBClient class in app/tvdb/client.py
 
     def get_series_episodes_by_season(self, series_id: int, season_number: Optional[int] = None) -> List[Dict]:
         """Get episodes of a TV series by season number."""
         try:
-            # Existing code to fetch episodes
-            season_type = "default"
-            endpoint = f"/series/{series_id}/episodes/{season_type}"
-            print(f"Fetching episodes from endpoint: {endpoint}")
+            # Filter by season if needed. The API filters server-side, but check
+            # again in case it ever hands back the whole list
+            if season_number is not None:
+                wanted = _season_key(season_number)
+                filtered_episodes = [
+                    episode for episode in self._series_episodes(series_id, wanted)
+                    if _season_key(episode.get("season_number", episode.get("seasonNumber"))) == wanted
+                ]
+                logger.debug("Filtered to %s episodes for season %s", len(filtered_episodes), season_number)
+                return filtered_episodes
 
-            response = self._make_request("GET", endpoint)
-            all_episodes_data = response.get("data", [])
+            # Return all episodes
+            return self._series_episodes(series_id)
 
-            if not all_episodes_data:
-                print(f"No episodes found for series {series_id}")
-                return []
+        except Exception as e:
+            logger.warning("Error in get_series_episodes_by_season: %s", e)
+            return []
 
-            print(f"Found {len(all_episodes_data)} total episodes for series {series_id}")
+    @cached()
+    def _series_episodes(self, series_id: int, season_number: Optional[int] = None) -> List[Dict]:
+        """Fetch and validate the episodes of a TV series.
 
-            # Convert raw dictionaries to Episode models
-            validated_episodes = []
-            for episode_data in all_episodes_data:
-                try:
-                    # Add series_id if it's missing in the API response
-                    if "series_id" not in episode_data and "seriesId" not in episode_data:
-                        episode_data["seriesId"] = series_id
+        Args:
+            series_id: The ID of the TV series
+            season_number: Only fetch this season's episodes; all seasons if omitted
 
-                    # Ensure episode has a name (required by your model)
-                    if "name" not in episode_data or not episode_data["name"]:
-                        episode_data["name"] = "Untitled Episode"
+        Returns:
+            Validated episodes
+        """
+        season_type = "default"
+        endpoint = f"/series/{series_id}/episodes/{season_type}"
+        params = {"season": season_number} if season_number is not None else None
+        logger.debug("Fetching episodes from endpoint: %s (season %s)", endpoint, season_number)
+
+        # Long-running shows return thousands of episodes; stream them so the
+        # raw response is never held in memory alongside the validated copies.
+        # The list sits under data.episodes, next to the series record.
+        validated_episodes = []
+        for episode_data in self._stream_items(endpoint, prefix="data.episodes.item", params=params):
+            try:
+                # Add series_id if it's missing in the API response
+                if "series_id" not in episode_data and "seriesId" not in episode_data:
+                    episode_data["seriesId"] = series_id
 
-                    # Create Episode model and validate the data with better error handling
-                    episode = Episode.parse_obj(episode_data)
-                    validated_episodes.append(episode.dict())
-                except Exception as e:
-                    print(f"Error validating episode: {e}")
-                    # For episodes, add a minimally processed version instead of skipping
-                    # This ensures we return something even if validation fails
-                    basic_episode = {
-                        "id": episode_data.get("id", 0),
-                        "seriesId": series_id,
-                        "name": episode_data.get("name", "Untitled"),
-                        "number": episode_data.get("number", episode_data.get("episodeNumber")),
-                        "seasonNumber": episode_data.get("seasonNumber", episode_data.get("season")),
-                        "overview": episode_data.get("overview", ""),
-                        "aired": episode_data.get("aired", episode_data.get("firstAired"))
-                    }
-                    validated_episodes.append(basic_episode)
+                # Ensure episode has a name (required by your model)
+                if "name" not in episode_data or not episode_data["name"]:
+                    episode_data["name"] = "Untitled Episode"
 
-            # Filter by season if needed
-            if season_number is not None:
-                filtered_episodes = []
-                for episode in validated_episodes:
-                    # Check season number with different possible field names
-                    ep_season = episode.get("season_number", episode.get("seasonNumber"))
-                    if ep_season == season_number or str(ep_season) == str(season_number):
-                        filtered_episodes.append(episode)
-
-                print(f"Filtered to {len(filtered_episodes)} episodes for season {season_number}")
-                return filtered_episodes
+                # Validate with the pydantic v2 API directly; parse_obj/dict are
+                # deprecated shims that warn and add overhead on every episode
+                validated_episodes.append(Episode.model_validate(episode_data).model_dump())
+            except Exception as e:
+                logger.warning("Error validating episode: %s", e)
+                # For episodes, add a minimally processed version instead of skipping
+                # This ensures we return something even if validation fails
+                basic_episode = {
+                    "id": episode_data.get("id", 0),
+                    "seriesId": series_id,
+                    "name": episode_data.get("name", "Untitled"),
+                    "number": episode_data.get("number", episode_data.get("episodeNumber")),
+                    "seasonNumber": episode_data.get("seasonNumber", episode_data.get("season")),
+                    "overview": episode_data.get("overview", ""),
+                    "aired": episode_data.get("aired", episode_data.get("firstAired"))
+                }
+                validated_episodes.append(basic_episode)
 
-            # Return all episodes
-            return validated_episodes
+        if not validated_episodes:
+            logger.debug("No episodes found for series %s", series_id)
+        else:
+            logger.debug("Found %s total episodes for series %s", len(validated_episodes), series_id)
 
-        except Exception as e:
-            print(f"Error in get_series_episodes_by_season: {e}")
-            return []
+        return validated_episodes
 
     def get_series_next_aired(self, series_id: int) -> Dict:
         """Get information about the next episode to air.
@@ -1761,46 +1026,38 @@ class TVDBClient:
         Returns:
             List of search results matching the criteria
         """
-        # Build search parameters
-        params = {}
-
-        # Add query parameter (handles both 'query' and 'q')
-        if query:
-            params["query"] = query
-
-        # Add filter parameters if provided
-        if type:
-            params["type"] = type
-        if year:
-            params["year"] = year
-        if country:
-            params["country"] = country
-        if company:
-            params["company"] = company
-        if language:
-            params["language"] = language
-        if director:
-            params["director"] = director
-        if primary_type:
-            params["primaryType"] = primary_type
-        if network:
-            params["network"] = network
-        if remote_id:
-            params["remote_id"] = remote_id
+        # Build search parameters, keeping only the filters that were given
+        params = {key: value for key, value in (
+            ("query", query),
+            ("type", type),
+            ("year", year),
+            ("country", country),
+            ("company", company),
+            ("language", language),
+            ("director", director),
+            ("primaryType", primary_type),
+            ("network", network),
+            ("remote_id", remote_id),
+        ) if value}
+
+        # A type on its own matches everything; don't make TVDB rank the whole catalogue
+        if params.keys() <= {"type"}:
+            logger.warning("Advanced search called without a query or filters; skipping request")
+            return []
 
         # Add pagination parameters
         params["offset"] = offset
         params["limit"] = limit
 
         # Make the request
-        print(f"Performing advanced search with parameters: {params}")
+        logger.debug("Performing advanced search with parameters: %s", params)
         try:
             response = self._make_request("GET", "/search", params=params)
             results = response.get("data", [])
-            print(f"Found {len(results)} results")
+            logger.debug("Found %s results", len(results))
             return results
         except TVDBError as e:
-            print(f"Search error: {e}")
+            logger.warning("Search error: %s", e)
             return []
 
     def search_movies(
@@ -1891,55 +1148,41 @@ class TVDBClient:
             List of awards for the series
         """
         try:
-            print(f"Fetching awards for series {series_id}")
+            logger.debug("Fetching awards for series %s", series_id)
+
+            # Fetch the extended series info and the direct awards endpoint together
+            extended_response, awards_response = self.batch_get([
+                (f"/series/{series_id}/extended", None),
+                (f"/series/{series_id}/awards", None),
+            ], ignore_errors=True)
 
             # Method 1: Try to get awards from extended series info
-            extended_info = self.get_series_details(series_id)
-            awards = extended_info.get("awards", [])
+            awards = (extended_response.get("data") or {}).get("awards", [])
 
             if awards:
-                print(f"Found {len(awards)} awards in extended series info")
+                logger.debug("Found %s awards in extended series info", len(awards))
                 return awards
 
             # Method 2: Try the direct series awards endpoint
-            print("No awards in extended info, trying direct awards endpoint")
-            endpoint = f"/series/{series_id}/awards"
-            response = self._make_request("GET", endpoint)
-            awards = response.get("data", [])
+            logger.debug("No awards in extended info, trying direct awards endpoint")
+            awards = awards_response.get("data", [])
 
             if awards:
-                print(f"Found {len(awards)} awards with direct endpoint")
+                logger.debug("Found %s awards with direct endpoint", len(awards))
                 return awards
 
             # Method 3: Try searching all awards for this series
-            print("No awards found with direct endpoint, trying awards search")
-            all_awards = self._make_request("GET", "/awards").get("data", [])
-
-            # Look for awards related to this series
-            series_awards = []
-            for award in all_awards:
-                # Check categories for this series
-                categories = award.get("categories", [])
-                for category in categories:
-                    records = category.get("records", [])
-                    for record in records:
-                        if record.get("seriesId") == series_id:
-                            series_awards.append({
-                                "award_name": award.get("name"),
-                                "category": category.get("name"),
-                                "year": record.get("year"),
-                                "nominee": record.get("nominee"),
-                                "won": record.get("isWinner", False)
-                            })
-
-            print(f"Found {len(series_awards)} awards through search")
+            logger.debug("No awards found with direct endpoint, trying awards search")
+            series_awards = self._awards_index()["series"].get(series_id, [])
+
+            logger.debug("Found %s awards through search", len(series_awards))
             return series_awards
 
         except TVDBError as e:
-            print(f"TVDB API Error getting awards: {e}")
+            logger.warning("TVDB API Error getting awards: %s", e)
             return []
         except Exception as e:
-            print(f"Unexpected error getting awards: {str(e)}")
+            logger.warning("Unexpected error getting awards: %s", e)
             return []
 
     def get_movie_awards(self, movie_id: int) -> List[Dict]:
@@ -1952,55 +1195,41 @@ class TVDBClient:
             List of awards for the movie
         """
         try:
-            print(f"Fetching awards for movie {movie_id}")
+            logger.debug("Fetching awards for movie %s", movie_id)
+
+            # Fetch the extended movie info and the direct awards endpoint together
+            extended_response, awards_response = self.batch_get([
+                (f"/movies/{movie_id}/extended", None),
+                (f"/movies/{movie_id}/awards", None),
+            ], ignore_errors=True)
 
             # Method 1: Try to get awards from extended movie info
-            extended_info = self._make_request("GET", f"/movies/{movie_id}/extended").get("data", {})
-            awards = extended_info.get("awards", [])
+            awards = (extended_response.get("data") or {}).get("awards", [])
 
             if awards:
-                print(f"Found {len(awards)} awards in extended movie info")
+                logger.debug("Found %s awards in extended movie info", len(awards))
                 return awards
 
             # Method 2: Try the direct movie awards endpoint
-            print("No awards in extended info, trying direct awards endpoint")
-            endpoint = f"/movies/{movie_id}/awards"
-            response = self._make_request("GET", endpoint)
-            awards = response.get("data", [])
+            logger.debug("No awards in extended info, trying direct awards endpoint")
+            awards = awards_response.get("data", [])
 
             if awards:
-                print(f"Found {len(awards)} awards with direct endpoint")
+                logger.debug("Found %s awards with direct endpoint", len(awards))
                 return awards
 
             # Method 3: Try searching all awards for this movie
-            print("No awards found with direct endpoint, trying awards search")
-            all_awards = self._make_request("GET", "/awards").get("data", [])
-
-            # Look for awards related to this movie
-            movie_awards = []
-            for award in all_awards:
-                # Check categories for this movie
-                categories = award.get("categories", [])
-                for category in categories:
-                    records = category.get("records", [])
-                    for record in records:
-                        if record.get("movieId") == movie_id:
-                            movie_awards.append({
-                                "award_name": award.get("name"),
-                                "category": category.get("name"),
-                                "year": record.get("year"),
-                                "nominee": record.get("nominee"),
-                                "won": record.get("isWinner", False)
-                            })
-
-            print(f"Found {len(movie_awards)} awards through search")
+            logger.debug("No awards found with direct endpoint, trying awards search")
+            movie_awards = self._awards_index()["movie"].get(movie_id, [])
+
+            logger.debug("Found %s awards through search", len(movie_awards))
             return movie_awards
 
         except TVDBError as e:
-            print(f"TVDB API Error getting movie awards: {e}")
+            logger.warning("TVDB API Error getting movie awards: %s", e)
             return []
         except Exception as e:
-            print(f"Unexpected error getting movie awards: {str(e)}")
+            logger.warning("Unexpected error getting movie awards: %s", e)
             return []
 
     def get_people_awards(self, person_id: int) -> List[Dict]:
@@ -2013,7 +1242,7 @@ class TVDBClient:
             List of awards for the person
         """
         try:
-            print(f"Fetching awards for person {person_id}")
+            logger.debug("Fetching awards for person %s", person_id)
 
             # Method 1: Try the direct person awards endpoint
             endpoint = f"/people/{person_id}/awards"
@@ -2021,40 +1250,89 @@ class TVDBClient:
             awards = response.get("data", [])
 
             if awards:
-                print(f"Found {len(awards)} awards with direct endpoint")
+                logger.debug("Found %s awards with direct endpoint", len(awards))
                 return awards
 
             # Method 2: Try searching all awards for this person
-            print("No awards found with direct endpoint, trying awards search")
-            all_awards = self._make_request("GET", "/awards").get("data", [])
-
-            # Look for awards related to this person
-            person_awards = []
-            for award in all_awards:
-                # Check categories for this person
-                categories = award.get("categories", [])
-                for category in categories:
-                    records = category.get("records", [])
-                    for record in records:
-                        if record.get("personId") == person_id:
-                            person_awards.append({
-                                "award_name": award.get("name"),
-                                "category": category.get("name"),
-                                "year": record.get("year"),
-                                "nominee": record.get("nominee"),
-                                "won": record.get("isWinner", False)
-                            })
-
-            print(f"Found {len(person_awards)} awards through search")
+            logger.debug("No awards found with direct endpoint, trying awards search")
+            person_awards = self._awards_index()["person"].get(person_id, [])
+
+            logger.debug("Found %s awards through search", len(person_awards))
             return person_awards
 
         except TVDBError as e:
-            print(f"TVDB API Error getting person awards: {e}")
+            logger.warning("TVDB API Error getting person awards: %s", e)
             return []
         except Exception as e:
-            print(f"Unexpected error getting person awards: {str(e)}")
+            logger.warning("Unexpected error getting person awards: %s", e)
             return []
 
+    @cached(ttl=24 * 60 * 60)
+    def _awards_index(self) -> Dict[str, Dict[int, List[Dict]]]:
+        """Index every award record by the series, movie and person it belongs to.
+
+        Returns:
+            Mapping of "series"/"movie"/"person" to {id: [award records]}
+        """
+        index = {"series": defaultdict(list), "movie": defaultdict(list), "person": defaultdict(list)}
+        id_keys = (("series", "seriesId"), ("movie", "movieId"), ("person", "personId"))
+
+        # The full awards list is large and only needed to build this index, so
+        # stream it award by award rather than caching the parsed payload
+        for award in self._stream_items("/awards"):
+            for category in award.get("categories", []):
+                for record in category.get("records", []):
+                    entry = {
+                        "award_name": award.get("name"),
+                        "category": category.get("name"),
+                        "year": record.get("year"),
+                        "nominee": record.get("nominee"),
+                        "won": record.get("isWinner", False)
+                    }
+                    for kind, id_key in id_keys:
+                        record_id = record.get(id_key)
+                        if record_id is not None:
+                            index[kind][record_id].append(entry)
+
+        # Plain dicts so a lookup miss doesn't grow the shared index
+        return {kind: dict(records) for kind, records in index.items()}
+
+    def get_awards_for_series_bulk(self, series_ids: List[int]) -> Dict[int, List[Dict]]:
+        """Get award records for many series from a single /awards download.
+
+        Args:
+            series_ids: IDs of the TV series
+
+        Returns:
+            Mapping of series ID to its award records
+        """
+        series_index = self._awards_index()["series"]
+        return {series_id: series_index.get(series_id, []) for series_id in series_ids}
+
+    def get_awards_for_movies_bulk(self, movie_ids: List[int]) -> Dict[int, List[Dict]]:
+        """Get award records for many movies from a single /awards download.
+
+        Args:
+            movie_ids: IDs of the movies
+
+        Returns:
+            Mapping of movie ID to its award records
+        """
+        movie_index = self._awards_index()["movie"]
+        return {movie_id: movie_index.get(movie_id, []) for movie_id in movie_ids}
+
+    def get_awards_for_people_bulk(self, person_ids: List[int]) -> Dict[int, List[Dict]]:
+        """Get award records for many people from a single /awards download.
+
+        Args:
+            person_ids: IDs of the people
+
+        Returns:
+            Mapping of person ID to their award records
+        """
+        person_index = self._awards_index()["person"]
+        return {person_id: person_index.get(person_id, []) for person_id in person_ids}
+
     def get_award_by_id(self, award_id: int) -> Dict:
         """Get detailed information about an award by ID.
 
@@ -2068,7 +1346,7 @@ class TVDBClient:
             response = self._make_request("GET", f"/awards/{award_id}")
             return response.get("data", {})
         except Exception as e:
-            print(f"Error getting award details: {e}")
+            logger.warning("Error getting award details: %s", e)
             return {}
 
     def get_award_category(self, category_id: int) -> Dict:
@@ -2084,7 +1362,7 @@ class TVDBClient:
             response = self._make_request("GET", f"/awards/categories/{category_id}")
             return response.get("data", {})
         except Exception as e:
-            print(f"Error getting award category details: {e}")
+            logger.warning("Error getting award category details: %s", e)
             return {}
 
     def get_award_extended(self, award_id: int) -> Dict:
@@ -2100,7 +1378,7 @@ class TVDBClient:
             response = self._make_request("GET", f"/awards/{award_id}/extended")
             return response.get("data", {})
         except Exception as e:
-            print(f"Error getting extended award details: {e}")
+            logger.warning("Error getting extended award details: %s", e)
             return {}
 
     def get_shows_by_network(self, network_name: str, limit: int = 5) -> List[Dict]:
@@ -2113,7 +1391,7 @@ class TVDBClient:
         Returns:
             List of shows from the specified network
         """
-        print(f"Searching for shows on network: {network_name}")
+        logger.debug("Searching for shows on network: %s", network_name)
 
         # Option 1: Try using network parameter in search
         params = {
@@ -2127,79 +1405,50 @@ class TVDBClient:
             results = response.get("data", [])
 
             if results:
-                print(f"Found {len(results)} shows using network parameter search")
+                logger.debug("Found %s shows using network parameter search", len(results))
+                # Dedupe before limiting so repeated ids don't cost result slots
                 return self._process_search_results(results)[:limit]
 
-            # Second approach: general search with network name
-            print("No results with network parameter, trying general search")
-
-            params = {
-                "query": network_name,
-                "type": "series"
-            }
+            # Second approach: general search with network name. It only runs
+            # after a miss; starting it up front doubled the upstream calls of
+            # every query the first search already answers
+            logger.debug("No results with network parameter, trying general search")
 
-            response = self._make_request("GET", "/search", params=params)
+            response = self._make_request(
+                "GET",
+                "/search",
+                params={"query": network_name, "type": "series"}
+            )
             results = response.get("data", [])
 
             if results:
-                print(f"Found {len(results)} shows using general search")
-
-                # Filter results to include only those that mention the network
-                network_lower = network_name.lower()
-
-                filtered_results = []
-                for show in results:
-                    # Check if network is mentioned in any of these fields
-                    if (
-                            network_lower in str(show.get("network", "")).lower() or
-                            network_lower in str(show.get("overview", "")).lower() or
-                            network_lower in str(show.get("name", "")).lower()
-                    ):
-                        filtered_results.append(show)
+                logger.debug("Found %s shows using general search", len(results))
+
+                # Keep the first `limit` distinct results that mention the network
+                # in any of these fields, case-folding the needle once
+                network_key = network_name.casefold()
+                matching = (
+                    show for show in self._process_search_results(results)
+                    if any(network_key in str(show.get(field, "")).casefold() for field in ("network", "name", "overview"))
+                )
+                filtered_results = list(islice(matching, limit))
 
-                print(f"Filtered to {len(filtered_results)} shows that mention {network_name}")
-                return self._process_search_results(filtered_results)[:limit]
+                logger.debug("Filtered to %s shows that mention %s", len(filtered_results), network_name)
+                return filtered_results
 
             # If both approaches fail, return hard-coded popular shows as a fallback
-            if network_name.lower() == "hbo":
-                print("Using fallback HBO shows list")
-                return [
-                    {
-                        "id": "series-82730",
-                        "name": "Game of Thrones",
-                        "network": "HBO",
-                        "overview": "Seven noble families fight for control of the mythical land of Westeros.",
-                        "status": {"name": "Ended"}
-                    },
-                    {
-                        "id": "series-374220",
-                        "name": "Succession",
-                        "network": "HBO",
-                        "overview": "The Roy family controls one of the biggest media and entertainment conglomerates in the world.",
-                        "status": {"name": "Ended"}
-                    },
-                    {
-                        "id": "series-371572",
-                        "name": "House of the Dragon",
-                        "network": "HBO",
-                        "overview": "The story of House Targaryen, 200 years before the events of Game of Thrones.",
-                        "status": {"name": "Continuing"}
-                    }
-                ]
-
-            # No results found
-            return []
+            logger.debug("No shows found on %s, using fallback list if any", network_name)
+            return self._network_fallback(network_name)
 
         except Exception as e:
-            print(f"Error searching for shows on {network_name}: {str(e)}")
-            # Return a minimal fallback for common networks if API fails
-            if network_name.lower() == "hbo":
-                return [
-                    {"id": "series-82730", "name": "Game of Thrones", "network": "HBO"},
-                    {"id": "series-374220", "name": "Succession", "network": "HBO"},
-                    {"id": "series-371572", "name": "House of the Dragon", "network": "HBO"}
-                ]
-            return []
+            logger.warning("Error searching for shows on %s: %s", network_name, e)
+            # Return a fallback for common networks if API fails
+            return self._network_fallback(network_name)
+
+    @staticmethod
+    def _network_fallback(network_name: str) -> List[Dict]:
+        """Copies of the hard-coded popular shows for a network, or [] if it has none."""
+        return [dict(show) for show in NETWORK_FALLBACKS.get(network_name.casefold(), ())]
 
     def _process_search_results(self, results: List[Dict]) -> List[Dict]:
         """Process and normalize search results into a consistent format.
@@ -2208,34 +1457,18 @@ class TVDBClient:
             results: Raw results from the TVDB API
 
         Returns:
-            Processed and normalized results
+            Processed and normalized results, each series only once
         """
+        seen_ids = set()
         processed_results = []
-
         for result in results:
-            try:
-                # Extract key information - handle different possible formats
-                series_info = {
-                    "id": result.get("id", result.get("tvdb_id")),
-                    "name": result.get("name", result.get("title", "")),
-                    "overview": result.get("overview", ""),
-                    "year": result.get("year", ""),
-                    "status": result.get("status", ""),
-                    "network": result.get("network", ""),
-                    "genres": result.get("genres", []),
-                    "image_url": result.get("image_url", result.get("poster", result.get("thumbnail", ""))),
-                }
-
-                # Normalize status field
-                if isinstance(series_info["status"], str):
-                    series_info["status"] = {"id": 0, "name": series_info["status"]}
-
-                processed_results.append(series_info)
-
-            except Exception as e:
-                print(f"Error processing result: {str(e)}")
-                # Add the original item as fallback
-                processed_results.append(result)
+            series_info = _normalize_series(result, genre_key="genres")
+            series_id = series_info.get("id") if isinstance(series_info, dict) else None
+            if series_id is not None:
+                if series_id in seen_ids:
+                    continue
+                seen_ids.add(series_id)
+            processed_results.append(series_info)
 
         return processed_results
 
@@ -2252,7 +1485,7 @@ class TVDBClient:
             response = self._make_request("GET", f"/movies/{movie_id}/extended")
             return response.get("data", {})
         except Exception as e:
-            print(f"Error getting movie details: {e}")
+            logger.warning("Error getting movie details: %s", e)
             return {}
 
     def get_movie_cast(self, movie_id: int) -> List[Dict]:
@@ -2266,7 +1499,13 @@ class TVDBClient:
         """
         try:
             # Try to get cast from extended info first
-            extended_info = self.get_movie_details(movie_id)
+            try:
+                extended_info = self._make_request(
+                    "GET", f"/movies/{movie_id}/extended", fields={"characters"}
+                ).get("data", {})
+            except TVDBError as e:
+                logger.warning("Error getting movie details: %s", e)
+                extended_info = {}
             cast = extended_info.get("characters", [])
 
             if cast:
@@ -2276,7 +1515,7 @@ class TVDBClient:
             response = self._make_request("GET", f"/movies/{movie_id}/cast")
             return response.get("data", [])
         except Exception as e:
-            print(f"Error getting movie cast: {e}")
+            logger.warning("Error getting movie cast: %s", e)
             return []
 
     def get_similar_movies(self, movie_id: int, limit: int = 5) -> List[Dict]:
@@ -2311,7 +1550,7 @@ class TVDBClient:
 
             return similar_movies[:limit]
         except Exception as e:
-            print(f"Error getting similar movies: {e}")
+            logger.warning("Error getting similar movies: %s", e)
             return []
 
     def get_movies_by_director(self, director_name: str, limit: int = 5) -> List[Dict]:
@@ -2348,7 +1587,7 @@ class TVDBClient:
             response = self._make_request("GET", endpoint)
             return response.get("data", {})
         except Exception as e:
-            print(f"Error getting movie translations: {e}")
+            logger.warning("Error getting movie translations: %s", e)
             return {}
 
     def get_movie_filter(self, filters: Dict[str, Any]) -> List[Dict]:
@@ -2378,7 +1617,7 @@ class TVDBClient:
             response = self._make_request("GET", f"/movies/{movie_id}/artworks")
             return response.get("data", [])
         except Exception as e:
-            print(f"Error getting movie artworks: {e}")
+            logger.warning("Error getting movie artworks: %s", e)
             return []
 
     def get_trending_movies(self, limit: int = 5) -> List[Dict]:
@@ -2391,7 +1630,7 @@ class TVDBClient:
             List of trending movies
         """
         try:
-            print("Attempting to fetch trending movies from TVDB API")
+            logger.debug("Attempting to fetch trending movies from TVDB API")
 
             # Try the trending endpoint if available
             try:
@@ -2399,14 +1638,14 @@ class TVDBClient:
                 trending = response.get("data", [])
 
                 if trending:
-                    print(f"Successfully retrieved {len(trending)} trending movies")
+                    logger.debug("Successfully retrieved %s trending movies", len(trending))
                     return trending[:limit]
             except TVDBError as e:
-                print(f"Error using trending endpoint: {e}")
+                logger.warning("Error using trending endpoint: %s", e)
                 trending = []
 
             # Fallback 1: Use filter with sort by score (popularity)
-            print("No trending movies found, trying filter by score")
+            logger.debug("No trending movies found, trying filter by score")
             try:
                 filters = {
                     "sort": "score",
@@ -2418,44 +1657,44 @@ class TVDBClient:
                 filtered = response.get("data", [])
 
                 if filtered:
-                    print(f"Found {len(filtered)} movies using score filter")
+                    logger.debug("Found %s movies using score filter", len(filtered))
                     return filtered[:limit]
             except TVDBError as e:
-                print(f"Error using filter endpoint: {e}")
+                logger.warning("Error using filter endpoint: %s", e)
                 filtered = []
 
             # Fallback 2: Search for recent or popular movies
-            print("Trying general search for recent or popular movies")
+            logger.debug("Trying general search for recent or popular movies")
             try:
                 # Search for popular movies
                 popular_results = self.search_movies(query="popular", limit=limit)
                 if popular_results:
-                    print(f"Found {len(popular_results)} popular movies via search")
+                    logger.debug("Found %s popular movies via search", len(popular_results))
                     return popular_results
 
                 # Try another search term
                 recent_results = self.search_movies(query="2023", limit=limit)
                 if recent_results:
-                    print(f"Found {len(recent_results)} recent movies via search")
+                    logger.debug("Found %s recent movies via search", len(recent_results))
                     return recent_results
             except Exception as e:
-                print(f"Error in fallback searches: {e}")
+                logger.warning("Error in fallback searches: %s", e)
 
             # Fallback 3: Last resort - search for any movies
-            print("Last resort: searching for any movies")
+            logger.debug("Last resort: searching for any movies")
             try:
                 basic_results = self.search_movies(query="movie", limit=limit)
                 if basic_results:
-                    print(f"Found {len(basic_results)} basic movie results")
+                    logger.debug("Found %s basic movie results", len(basic_results))
                     return basic_results
             except Exception as e:
-                print(f"Error in basic movie search: {e}")
+                logger.warning("Error in basic movie search: %s", e)
 
             # If all else fails
             return []
 
         except Exception as e:
-            print(f"Error getting trending movies: {str(e)}")
+            logger.warning("Error getting trending movies: %s", e)
             return []
 
     def recommend_movies(self, criteria: Dict[str, Any], limit: int = 5) -> List[Dict]:
@@ -2468,40 +1707,40 @@ class TVDBClient:
         Returns:
             List of recommended movies
         """
-        print(f"Recommending movies with criteria: {criteria}")
+        logger.debug("Recommending movies with criteria: %s", criteria)
         results = []
 
         # Try to find by genre first
         if "genres" in criteria and criteria["genres"]:
-            print(f"Searching by genres: {criteria['genres']}")
+            logger.debug("Searching by genres: %s", criteria['genres'])
             for genre in criteria["genres"][:2]:  # Use top 2 genres
                 try:
                     genre_results = self.get_movies_by_genre(genre, limit=3)
                     if genre_results:
-                        print(f"Found {len(genre_results)} movies for genre '{genre}'")
+                        logger.debug("Found %s movies for genre '%s'", len(genre_results), genre)
                         results.extend(genre_results)
                     else:
-                        print(f"No results for genre '{genre}'")
+                        logger.debug("No results for genre '%s'", genre)
                 except Exception as e:
-                    print(f"Error searching for genre '{genre}': {e}")
+                    logger.warning("Error searching for genre '%s': %s", genre, e)
 
         # Try to find by director
         if "directors" in criteria and criteria["directors"]:
-            print(f"Searching by directors: {criteria['directors']}")
+            logger.debug("Searching by directors: %s", criteria['directors'])
             for director in criteria["directors"][:2]:  # Use top 2 directors
                 try:
                     director_results = self.get_movies_by_director(director, limit=3)
                     if director_results:
-                        print(f"Found {len(director_results)} movies by director '{director}'")
+                        logger.debug("Found %s movies by director '%s'", len(director_results), director)
                         results.extend(director_results)
                     else:
-                        print(f"No results for director '{director}'")
+                        logger.debug("No results for director '%s'", director)
                 except Exception as e:
-                    print(f"Error searching for director '{director}': {e}")
+                    logger.warning("Error searching for director '%s': %s", director, e)
 
         # Try to find by actor (using advanced search)
         if "actors" in criteria and criteria["actors"]:
-            print(f"Searching by actors: {criteria['actors']}")
+            logger.debug("Searching by actors: %s", criteria['actors'])
             for actor in criteria["actors"][:2]:  # Use top 2 actors
                 try:
                     # Find the actor first
@@ -2509,42 +1748,42 @@ class TVDBClient:
                     if actor_search:
                         actor_id = actor_search[0].get("id")
                         if actor_id:
-                            print(f"Found actor ID {actor_id} for '{actor}'")
+                            logger.debug("Found actor ID %s for '%s'", actor_id, actor)
                             # Now search for movies with this actor
                             # This would need a specific endpoint which might not be available
                             # For now, use general search with actor name
                             actor_results = self.search_movies(query=actor, limit=3)
                             if actor_results:
-                                print(f"Found {len(actor_results)} movies with actor '{actor}'")
+                                logger.debug("Found %s movies with actor '%s'", len(actor_results), actor)
                                 results.extend(actor_results)
                             else:
-                                print(f"No movie results for actor '{actor}'")
+                                logger.debug("No movie results for actor '%s'", actor)
                     else:
-                        print(f"Actor '{actor}' not found")
+                        logger.debug("Actor '%s' not found", actor)
                 except Exception as e:
-                    print(f"Error searching for actor '{actor}': {e}")
+                    logger.warning("Error searching for actor '%s': %s", actor, e)
 
         # If no results found, try a fallback
         if not results:
-            print("No results found with provided criteria, trying fallbacks")
+            logger.debug("No results found with provided criteria, trying fallbacks")
 
             # Try trending movies
             try:
                 trending = self.get_trending_movies(limit=limit)
                 if trending:
-                    print(f"Using {len(trending)} trending movies as fallback")
+                    logger.debug("Using %s trending movies as fallback", len(trending))
                     return trending
             except Exception as e:
-                print(f"Error getting trending movies fallback: {e}")
+                logger.warning("Error getting trending movies fallback: %s", e)
 
             # Last resort - basic search
             try:
                 fallback = self.search_movies(query="movie", limit=limit)
                 if fallback:
-                    print(f"Using {len(fallback)} basic movie results as fallback")
+                    logger.debug("Using %s basic movie results as fallback", len(fallback))
                     return fallback
             except Exception as e:
-                print(f"Error in basic fallback search: {e}")
+                logger.warning("Error in basic fallback search: %s", e)
 
             return []
 
@@ -2558,7 +1797,7 @@ class TVDBClient:
                 seen_ids.add(movie_id)
                 unique_results.append(movie)
 
-        print(f"Returning {len(unique_results[:limit])} unique movie recommendations")
+        logger.debug("Returning %s unique movie recommendations", min(len(unique_results), limit))
         return unique_results[:limit]
 
     def get_movies_by_genre(self, genre: str, limit: int = 5) -> List[Dict]:
@@ -2571,14 +1810,14 @@ class TVDBClient:
         Returns:
             List of movies in the specified genre
         """
-        print(f"Searching for movies with genre: {genre}")
+        logger.debug("Searching for movies with genre: %s", genre)
 
         try:
             # First approach: direct search using genre as query
             results = self.search_movies(query=genre, limit=limit)
 
             if results:
-                print(f"Found {len(results)} movies for genre '{genre}' via direct search")
+                logger.debug("Found %s movies for genre '%s' via direct search", len(results), genre)
                 return results
 
             # Second approach: try advanced search with type=movie
@@ -2589,13 +1828,13 @@ class TVDBClient:
             )
 
             if advanced_results:
-                print(f"Found {len(advanced_results)} movies for genre '{genre}' via advanced search")
+                logger.debug("Found %s movies for genre '%s' via advanced search", len(advanced_results), genre)
                 return advanced_results
 
             # If both fail, return empty list
-            print(f"No results found for genre '{genre}'")
+            logger.debug("No results found for genre '%s'", genre)
             return []
 
         except Exception as e:
-            print(f"Error searching for movies in genre '{genre}': {e}")
+            logger.warning("Error searching for movies in genre '%s': %s", genre, e)
             return []
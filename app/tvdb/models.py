@@ -1,8 +1,13 @@
 """Data models for the TV Series Recommender."""
 
-from typing import List, Optional, Dict, Any, Union
-from datetime import datetime
-from pydantic import BaseModel, Field, validator
+from typing import List, Optional, Dict, Any
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+# Shared by every model that maps TVDB's camelCase keys onto snake_case fields
+MODEL_CONFIG = ConfigDict(populate_by_name=True)
+
+# For models the app rarely validates: build their schema on first use, not at import
+DEFERRED_MODEL_CONFIG = ConfigDict(populate_by_name=True, defer_build=True)
 
 
 class Translation(BaseModel):
@@ -55,9 +60,7 @@ class Character(BaseModel):
     overview: Optional[str] = None
     people_type: Optional[str] = Field(None, alias="peopleType")
 
-    class Config:
-        """Pydantic config."""
-        populate_by_name = True
+    model_config = MODEL_CONFIG
 
 
 class Season(BaseModel):
@@ -71,9 +74,7 @@ class Season(BaseModel):
     type: Optional[Dict[str, Any]] = None
     episodes: Optional[List[Dict[str, Any]]] = None
 
-    class Config:
-        """Pydantic config."""
-        populate_by_name = True
+    model_config = MODEL_CONFIG
 
 
 class Episode(BaseModel):
@@ -92,9 +93,7 @@ class Episode(BaseModel):
     name_translations: Optional[List[str]] = Field(None, alias="nameTranslations")
     overview_translations: Optional[List[str]] = Field(None, alias="overviewTranslations")
 
-    class Config:
-        """Pydantic config."""
-        populate_by_name = True
+    model_config = MODEL_CONFIG
 
 
 class Award(BaseModel):
@@ -104,9 +103,7 @@ class Award(BaseModel):
     name: str
     categories: Optional[List[Dict[str, Any]]] = None
 
-    class Config:
-        """Pydantic config."""
-        populate_by_name = True
+    model_config = DEFERRED_MODEL_CONFIG
 
 
 class AwardCategory(BaseModel):
@@ -117,9 +114,7 @@ class AwardCategory(BaseModel):
     award_id: int = Field(..., alias="awardId")
     allowed_types: List[str] = Field([], alias="allowedTypes")
 
-    class Config:
-        """Pydantic config."""
-        populate_by_name = True
+    model_config = DEFERRED_MODEL_CONFIG
 
 
 class AwardRecord(BaseModel):
@@ -136,9 +131,7 @@ class AwardRecord(BaseModel):
     person_id: Optional[int] = Field(None, alias="personId")
     is_winner: Optional[bool] = Field(None, alias="isWinner")
 
-    class Config:
-        """Pydantic config."""
-        populate_by_name = True
+    model_config = DEFERRED_MODEL_CONFIG
 
 
 class MovieBase(BaseModel):
@@ -157,9 +150,7 @@ class MovieBase(BaseModel):
     runtime: Optional[int] = None
     year: Optional[str] = None
 
-    class Config:
-        """Pydantic config."""
-        populate_by_name = True
+    model_config = DEFERRED_MODEL_CONFIG
 
 
 class SeriesBase(BaseModel):
@@ -170,8 +161,8 @@ class SeriesBase(BaseModel):
     slug: str
     aliases: Optional[List[str]] = None
     image: Optional[str] = None
-    # Allow status to be either a string or a Status object
-    status: Optional[Union[str, Status]] = None
+    # TVDB sometimes sends a bare string; validate_status turns it into a Status
+    status: Optional[Status] = None
     original_network: Optional[Network] = Field(None, alias="originalNetwork")
     overview: Optional[str] = None
     first_aired: Optional[str] = Field(None, alias="firstAired")
@@ -180,12 +171,11 @@ class SeriesBase(BaseModel):
     name_translations: Optional[List[str]] = Field(None, alias="nameTranslations")
     overview_translations: Optional[List[str]] = Field(None, alias="overviewTranslations")
 
-    class Config:
-        """Pydantic config."""
-        populate_by_name = True
+    model_config = MODEL_CONFIG
 
     # Add a validator to handle string status values
-    @validator('status', pre=True)
+    @field_validator('status', mode='before')
+    @classmethod
     def validate_status(cls, v):
         if isinstance(v, str):
             # Create a simple Status object from string
@@ -201,9 +191,7 @@ class Series(SeriesBase):
     characters: Optional[List[Character]] = None
     awards: Optional[List[Dict[str, Any]]] = None
 
-    class Config:
-        """Pydantic config."""
-        populate_by_name = True
+    model_config = MODEL_CONFIG
 
 
 class PeopleBase(BaseModel):
@@ -217,9 +205,7 @@ class PeopleBase(BaseModel):
     overview_translations: Optional[List[str]] = Field(None, alias="overviewTranslations")
     score: Optional[float] = None
 
-    class Config:
-        """Pydantic config."""
-        populate_by_name = True
+    model_config = DEFERRED_MODEL_CONFIG
 
 
 class Company(BaseModel):
@@ -233,9 +219,7 @@ class Company(BaseModel):
     primary_type: Optional[int] = Field(None, alias="primaryType")
     country: Optional[str] = None
 
-    class Config:
-        """Pydantic config."""
-        populate_by_name = True
+    model_config = DEFERRED_MODEL_CONFIG
 
 
 class SearchResult(BaseModel):
@@ -254,9 +238,7 @@ class SearchResult(BaseModel):
     tvdb_id: Optional[int] = Field(None, alias="tvdb_id")
     imdb_id: Optional[str] = Field(None, alias="imdb_id")
 
-    class Config:
-        """Pydantic config."""
-        populate_by_name = True
+    model_config = MODEL_CONFIG
 
 
 class UserPreference(BaseModel):
@@ -267,9 +249,7 @@ class UserPreference(BaseModel):
     favorite_actors: List[str] = Field(default_factory=list, alias="favoriteActors")
     preferred_networks: List[str] = Field(default_factory=list, alias="preferredNetworks")
 
-    class Config:
-        """Pydantic config."""
-        populate_by_name = True
+    model_config = MODEL_CONFIG
 
 
 class UserQuery(BaseModel):
@@ -279,9 +259,7 @@ class UserQuery(BaseModel):
     intent: str
     parameters: Dict[str, Any] = Field(default_factory=dict)
 
-    class Config:
-        """Pydantic config."""
-        populate_by_name = True
+    model_config = MODEL_CONFIG
 
 
 class ConversationContext(BaseModel):
@@ -291,9 +269,7 @@ class ConversationContext(BaseModel):
     user_preferences: UserPreference = Field(default_factory=UserPreference, alias="userPreferences")
     last_series_context: Optional[List[int]] = Field(default_factory=list, alias="lastSeriesContext")
 
-    class Config:
-        """Pydantic config."""
-        populate_by_name = True
+    model_config = MODEL_CONFIG
 
 
 # API Request/Response models
@@ -1,7 +1,7 @@
 """Minimal TVDB API test."""
 
 import os
-import json
+import orjson
 import requests
 from dotenv import load_dotenv
 
@@ -9,6 +9,9 @@ from dotenv import load_dotenv
 load_dotenv()
 API_KEY = os.getenv("TVDB_API_KEY")
 
+# One session for all calls so the search requests reuse the login's connection
+session = requests.Session()
+
 
 # Try to authenticate
 def test_auth():
@@ -17,13 +20,13 @@ def test_auth():
     payload = {"apikey": API_KEY}
 
     try:
-        response = requests.post(url, json=payload)
+        response = session.post(url, json=payload)
         print(f"Status code: {response.status_code}")
-        print(f"Response: {response.text[:200]}...")  # Show first 200 chars
+        print(f"Response: {response.content[:200].decode(errors='replace')}...")  # Show first 200 chars
 
         if response.status_code == 200:
             print("Authentication successful!")
-            data = response.json()
+            data = orjson.loads(response.content)
             token = data["data"]["token"]
             return token
         else:
@@ -51,12 +54,12 @@ def test_search(token):
 
     try:
         print(f"Making request to {url} with params {params}")
-        response = requests.get(url, headers=headers, params=params)
+        response = session.get(url, headers=headers, params=params)
         print(f"Status code: {response.status_code}")
-        print(f"Response: {response.text[:300]}...")  # First 300 chars
+        print(f"Response: {response.content[:300].decode(errors='replace')}...")  # First 300 chars
 
         if response.status_code == 200:
-            data = response.json()
+            data = orjson.loads(response.content)
             results = data.get("data", [])
             print(f"Found {len(results)} results")
             for i, item in enumerate(results[:5], 1):
@@ -84,12 +87,12 @@ def test_search_by_type(token):
 
     try:
         print(f"Making request to {url} with params {params}")
-        response = requests.get(url, headers=headers, params=params)
+        response = session.get(url, headers=headers, params=params)
         print(f"Status code: {response.status_code}")
-        print(f"Response: {response.text[:300]}...")  # First 300 chars
+        print(f"Response: {response.content[:300].decode(errors='replace')}...")  # First 300 chars
 
         if response.status_code == 200:
-            data = response.json()
+            data = orjson.loads(response.content)
             results = data.get("data", [])
             print(f"Found {len(results)} results")
             for i, item in enumerate(results[:5], 1):
@@ -0,0 +1,153 @@
+"""Unit tests for the chat micro-batcher."""
+
+import asyncio
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+# The bot module builds its OpenAI client on import; no request is ever sent here
+os.environ.setdefault("OPENAI_API_KEY", "test")
+
+from app.chatbot.batcher import ChatBatcher  # noqa: E402
+
+
+class FakeBot:
+    """Records every batch and answers each query with its own text."""
+
+    def __init__(self, error=None, release=None):
+        self.batches = []
+        self.error = error
+        self.release = release
+        self.started = threading.Event()
+
+    def process_batch(self, queries):
+        self.batches.append(list(queries))
+        self.started.set()
+        if self.release is not None:
+            self.release.wait(5)
+        if self.error is not None:
+            raise self.error
+        return [(f"reply to {message}", session_id or "new") for message, session_id in queries]
+
+
+def run(coro_fn, bot, **kwargs):
+    """Run coro_fn(batcher) on a fresh event loop with a private executor."""
+    async def main():
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            batcher = ChatBatcher(bot, executor=executor, **kwargs)
+            try:
+                return await coro_fn(batcher)
+            finally:
+                await batcher.close()
+
+    return asyncio.run(main())
+
+
+def test_results_map_to_their_callers():
+    bot = FakeBot()
+
+    async def scenario(batcher):
+        return await asyncio.gather(
+            batcher.submit("a", "s1"),
+            batcher.submit("b"),
+            batcher.submit("c", "s3"),
+        )
+
+    results = run(scenario, bot, max_wait=0.05)
+
+    assert results == [("reply to a", "s1"), ("reply to b", "new"), ("reply to c", "s3")]
+    assert bot.batches == [[("a", "s1"), ("b", None), ("c", "s3")]]
+
+
+def test_failing_batch_fails_every_caller():
+    error = RuntimeError("bot down")
+    bot = FakeBot(error=error)
+
+    async def scenario(batcher):
+        return await asyncio.gather(
+            batcher.submit("a"),
+            batcher.submit("b"),
+            return_exceptions=True,
+        )
+
+    results = run(scenario, bot, max_wait=0.05)
+
+    assert results == [error, error]
+    assert len(bot.batches) == 1
+
+
+def test_batches_respect_max_batch_size():
+    bot = FakeBot()
+
+    async def scenario(batcher):
+        return await asyncio.gather(*(batcher.submit(str(i)) for i in range(5)))
+
+    results = run(scenario, bot, max_batch_size=2, max_wait=0.05)
+
+    assert [reply for reply, _ in results] == [f"reply to {i}" for i in range(5)]
+    assert [len(batch) for batch in bot.batches] == [2, 2, 1]
+
+
+def test_queries_after_max_wait_go_in_the_next_batch():
+    bot = FakeBot()
+
+    async def scenario(batcher):
+        first = asyncio.create_task(batcher.submit("a"))
+        await asyncio.sleep(0.1)
+        second = await batcher.submit("b")
+        return [await first, second]
+
+    results = run(scenario, bot, max_wait=0.02)
+
+    assert [reply for reply, _ in results] == ["reply to a", "reply to b"]
+    assert bot.batches == [[("a", None)], [("b", None)]]
+
+
+def test_close_cancels_the_worker():
+    bot = FakeBot()
+
+    async def scenario(batcher):
+        await batcher.submit("a")
+        worker = batcher._worker
+        await batcher.close()
+        return worker
+
+    worker = run(scenario, bot)
+
+    assert worker.cancelled()
+
+
+def test_close_waits_for_dispatched_batches():
+    release = threading.Event()
+    bot = FakeBot(release=release)
+
+    async def scenario(batcher):
+        pending = asyncio.create_task(batcher.submit("a"))
+        await asyncio.get_running_loop().run_in_executor(None, bot.started.wait, 5)
+        closing = asyncio.create_task(batcher.close())
+        await asyncio.sleep(0.05)
+        assert not closing.done()
+
+        release.set()
+        await closing
+        assert not batcher._dispatching
+        return await pending
+
+    assert run(scenario, bot) == ("reply to a", "new")
+
+
+def test_close_cancels_queries_not_yet_dispatched():
+    bot = FakeBot()
+
+    async def scenario(batcher):
+        pending = asyncio.create_task(batcher.submit("a"))
+        await asyncio.sleep(0.05)
+        await batcher.close()
+        with pytest.raises(asyncio.CancelledError):
+            await pending
+
+    run(scenario, bot, max_wait=10)
+
+    assert bot.batches == []
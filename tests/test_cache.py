@@ -0,0 +1,266 @@
+"""Unit tests for the TVDB client's caching helpers."""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from app.tvdb import cache
+from app.tvdb.cache import SingleFlight, TTLCache, cached
+
+
+class FakeClock:
+    """Stand-in for time.monotonic that only moves when told to."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, seconds):
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(cache.time, "monotonic", fake)
+    return fake
+
+
+class FakeClient:
+    """Minimal owner for @cached methods, counting the underlying calls."""
+
+    def __init__(self, results=None, error=None):
+        self._cache = TTLCache(maxsize=16, ttl=100)
+        self._inflight = SingleFlight()
+        self.results = results if results is not None else {}
+        self.error = error
+        self.calls = 0
+
+    @cached(ttl=30, negative_ttl=5)
+    def lookup(self, name):
+        self.calls += 1
+        if self.error is not None:
+            raise self.error
+        return self.results.get(name, [])
+
+
+def test_ttl_cache_expires_entries(clock):
+    ttl_cache = TTLCache(ttl=10)
+    ttl_cache.set("a", 1)
+    ttl_cache.set("b", 2, ttl=30)
+
+    clock.advance(9)
+    assert ttl_cache.get("a") == 1
+
+    clock.advance(1)
+    assert ttl_cache.get("a") is None
+    assert ttl_cache.get("a", "missing") == "missing"
+    assert ttl_cache.get("b") == 2
+
+
+def test_ttl_cache_serves_stale_within_window(clock):
+    ttl_cache = TTLCache(ttl=10, stale_ttl=20)
+    ttl_cache.set("a", 1)
+
+    clock.advance(15)
+    assert ttl_cache.get("a") is None
+    assert ttl_cache.get_stale("a") == 1
+
+    clock.advance(15)
+    assert ttl_cache.get_stale("a") is None
+    assert len(ttl_cache) == 0
+
+
+def test_ttl_cache_without_stale_window_drops_expired(clock):
+    ttl_cache = TTLCache(ttl=10)
+    ttl_cache.set("a", 1)
+
+    clock.advance(10)
+    assert ttl_cache.get_stale("a") is None
+    assert len(ttl_cache) == 0
+
+
+def test_ttl_cache_evicts_oldest_when_full(clock):
+    ttl_cache = TTLCache(maxsize=2, ttl=10)
+    ttl_cache.set("a", 1)
+    ttl_cache.set("b", 2)
+    ttl_cache.set("c", 3)
+
+    assert len(ttl_cache) == 2
+    assert ttl_cache.get("a") is None
+    assert ttl_cache.get("b") == 2
+    assert ttl_cache.get("c") == 3
+
+
+def test_ttl_cache_evicts_dead_entries_first(clock):
+    ttl_cache = TTLCache(maxsize=2, ttl=10)
+    ttl_cache.set("a", 1)
+    ttl_cache.set("b", 2, ttl=1)
+
+    clock.advance(2)
+    ttl_cache.set("c", 3)
+
+    assert ttl_cache.get("a") == 1
+    assert ttl_cache.get("c") == 3
+
+
+def test_ttl_cache_overwriting_a_key_does_not_evict(clock):
+    ttl_cache = TTLCache(maxsize=2, ttl=10)
+    ttl_cache.set("a", 1)
+    ttl_cache.set("b", 2)
+    ttl_cache.set("a", 3)
+
+    assert ttl_cache.get("a") == 3
+    assert ttl_cache.get("b") == 2
+
+
+def test_ttl_cache_invalidate(clock):
+    ttl_cache = TTLCache(ttl=10)
+    ttl_cache.set("a", 1)
+    ttl_cache.set("b", 2)
+
+    ttl_cache.invalidate("a")
+    assert ttl_cache.get("a") is None
+    assert ttl_cache.get("b") == 2
+
+    ttl_cache.invalidate()
+    assert len(ttl_cache) == 0
+
+
+def run_concurrently(sf, key, fn, callers):
+    """Start one leader call, then `callers` more while it is still running."""
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def slow():
+        calls.append(1)
+        started.set()
+        release.wait(5)
+        return fn()
+
+    def call():
+        try:
+            return sf.do(key, slow)
+        except Exception as e:
+            return e
+
+    with ThreadPoolExecutor(max_workers=callers + 1) as pool:
+        leader = pool.submit(call)
+        assert started.wait(5)
+        followers = [pool.submit(call) for _ in range(callers)]
+        # Give the followers time to join the in-flight call before it finishes
+        time.sleep(0.1)
+        release.set()
+        outcomes = [leader.result(5)] + [f.result(5) for f in followers]
+
+    return calls, outcomes
+
+
+def test_single_flight_shares_one_call():
+    sf = SingleFlight()
+    result = object()
+
+    calls, outcomes = run_concurrently(sf, "key", lambda: result, callers=4)
+
+    assert len(calls) == 1
+    assert all(outcome is result for outcome in outcomes)
+    assert sf._calls == {}
+
+
+def test_single_flight_shares_one_exception():
+    sf = SingleFlight()
+    error = RuntimeError("boom")
+
+    def fail():
+        raise error
+
+    calls, outcomes = run_concurrently(sf, "key", fail, callers=4)
+
+    assert len(calls) == 1
+    assert all(outcome is error for outcome in outcomes)
+    assert sf._calls == {}
+
+
+def test_single_flight_runs_again_after_completion():
+    sf = SingleFlight()
+
+    assert sf.do("key", lambda: 1) == 1
+    assert sf.do("key", lambda: 2) == 2
+
+
+def test_cached_reuses_results_until_ttl(clock):
+    client = FakeClient(results={"x": [1, 2]})
+
+    assert client.lookup("x") == [1, 2]
+    assert client.lookup("x") == [1, 2]
+    assert client.calls == 1
+
+    clock.advance(30)
+    assert client.lookup("x") == [1, 2]
+    assert client.calls == 2
+
+
+def test_cached_returns_copies(clock):
+    client = FakeClient(results={"x": [{"id": 1}]})
+
+    first = client.lookup("x")
+    first[0]["id"] = 2
+    first.append({"id": 3})
+
+    assert client.lookup("x") == [{"id": 1}]
+
+
+def test_cached_uses_negative_ttl_for_empty_results(clock):
+    client = FakeClient()
+
+    assert client.lookup("missing") == []
+    clock.advance(4)
+    assert client.lookup("missing") == []
+    assert client.calls == 1
+
+    clock.advance(1)
+    client.lookup("missing")
+    assert client.calls == 2
+
+
+def test_cached_does_not_cache_errors(clock):
+    client = FakeClient(error=RuntimeError("down"))
+
+    with pytest.raises(RuntimeError):
+        client.lookup("x")
+
+    client.error = None
+    client.results = {"x": [1]}
+    assert client.lookup("x") == [1]
+    assert client.calls == 2
+
+
+def test_cached_drops_entry_whose_refresh_failed(clock):
+    client = FakeClient(results={"x": [1]})
+    client.lookup("x")
+
+    clock.advance(30)
+    client.error = RuntimeError("down")
+    with pytest.raises(RuntimeError):
+        client.lookup("x")
+
+    assert len(client._cache) == 0
+
+
+def test_cached_key_function():
+    class KeyedClient(FakeClient):
+        @cached(key=lambda name, limit=5: name.casefold())
+        def lookup(self, name, limit=5):
+            self.calls += 1
+            return [name]
+
+    client = KeyedClient()
+
+    assert client.lookup("Drama") == ["Drama"]
+    assert client.lookup("drama", limit=10) == ["Drama"]
+    assert client.calls == 1
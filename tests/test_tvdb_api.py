@@ -2,7 +2,7 @@
 
 import os
 import sys
-import json
+import orjson
 from datetime import datetime
 from dotenv import load_dotenv
 import requests
@@ -15,6 +15,9 @@ TVDB_API_URL = "https://api4.thetvdb.com/v4"
 TVDB_API_KEY = os.getenv("TVDB_API_KEY")
 TVDB_PIN = os.getenv("TVDB_PIN")
 
+# One session for all calls so the search requests reuse the login's connection
+session = requests.Session()
+
 
 def get_token():
     """Get an access token from the TVDB API."""
@@ -33,11 +36,11 @@ def get_token():
     if TVDB_PIN and TVDB_PIN.strip():
         payload["pin"] = TVDB_PIN
 
-    print(f"Login payload: {json.dumps(payload)}")
+    print(f"Login payload: {orjson.dumps(payload).decode()}")
 
     # Make the request
     try:
-        response = requests.post(
+        response = session.post(
             login_url,
             json=payload,
             headers={"Content-Type": "application/json"}
@@ -50,7 +53,7 @@ def get_token():
             print(f"Authentication failed: {response.text}")
             return None
 
-        data = response.json()
+        data = orjson.loads(response.content)
         token = data["data"]["token"]
         print("Authentication successful!")
         return token
@@ -76,16 +79,16 @@ def search_series(token, query, limit=5):
 
     print(f"Searching for series matching '{query}'...")
     try:
-        response = requests.get(search_url, headers=headers, params=params)
+        response = session.get(search_url, headers=headers, params=params)
 
         print(f"Search response status: {response.status_code}")
-        print(f"Search response: {response.text[:200]}...")  # Show first 200 chars to avoid too much output
+        print(f"Search response: {response.content[:200].decode(errors='replace')}...")  # Show first 200 chars to avoid too much output
 
         if response.status_code != 200:
             print(f"Search failed: {response.text}")
             return []
 
-        data = response.json()
+        data = orjson.loads(response.content)
         results = data.get("data", [])
         # Limit results
         return results[:limit]
@@ -0,0 +1,382 @@
+"""Unit tests for TVDBClient against a fake TVDB server."""
+
+import io
+import os
+import threading
+import time
+from urllib.parse import parse_qs, urlsplit
+
+import orjson
+import pytest
+from requests.adapters import HTTPAdapter
+from urllib3.response import HTTPResponse
+
+from app.tvdb import cache as cache_module
+from app.tvdb import client as client_module
+from app.tvdb.client import TVDBClient, TVDBError, _response_ttl
+
+
+class FakeTVDB(HTTPAdapter):
+    """Transport adapter answering requests from per-path handlers.
+
+    Handlers take the prepared request and return (status, body, headers),
+    where body is JSON-serializable data or raw bytes.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.routes = {}
+        self.requests = []
+        self.logins = 0
+
+    def route(self, method, path, handler):
+        self.routes[(method, path)] = handler
+
+    def reply(self, method, path, status=200, body=None, headers=None):
+        self.route(method, path, lambda request: (status, body, headers or {}))
+
+    def calls(self, path):
+        return [request for request in self.requests if urlsplit(request.url).path.endswith(path)]
+
+    def send(self, request, **kwargs):
+        self.requests.append(request)
+        path = urlsplit(request.url).path[len("/v4"):]
+
+        if (request.method, path) == ("POST", "/login"):
+            self.logins += 1
+            status, body, headers = 200, {"data": {"token": f"token-{self.logins}"}}, {}
+        else:
+            status, body, headers = self.routes[(request.method, path)](request)
+
+        if not isinstance(body, bytes):
+            body = orjson.dumps(body)
+        raw = HTTPResponse(
+            body=io.BytesIO(body),
+            headers=headers,
+            status=status,
+            preload_content=False,
+            decode_content=False
+        )
+        return self.build_response(request, raw)
+
+
+class FakeClock:
+    """Stand-in for time.monotonic that only moves when told to."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, seconds):
+        self.now += seconds
+
+
+@pytest.fixture
+def fake_api():
+    return FakeTVDB()
+
+
+@pytest.fixture
+def token_dir(monkeypatch, tmp_path):
+    monkeypatch.setattr(client_module, "load_dotenv", lambda: None)
+    monkeypatch.setattr(client_module, "TOKEN_CACHE_DIR", str(tmp_path))
+    monkeypatch.setenv("TVDB_API_KEY", "test-key")
+    monkeypatch.delenv("TVDB_PIN", raising=False)
+    return tmp_path
+
+
+@pytest.fixture
+def make_client(token_dir, fake_api):
+    clients = []
+
+    def make():
+        tvdb = TVDBClient()
+        tvdb._session.mount("https://", fake_api)
+        clients.append(tvdb)
+        return tvdb
+
+    yield make
+    for tvdb in clients:
+        tvdb.close()
+
+
+@pytest.fixture
+def client(make_client):
+    return make_client()
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(cache_module.time, "monotonic", fake)
+    return fake
+
+
+def bearer(request):
+    return request.headers.get("Authorization", "")
+
+
+def test_series_episodes_streams_the_episode_list(client, fake_api):
+    fake_api.reply("GET", "/series/81189/episodes/default", body={
+        "status": "success",
+        "data": {
+            "series": {"id": 81189, "name": "Breaking Bad"},
+            "episodes": [
+                {"id": 349232, "seriesId": 81189, "name": "Pilot", "seasonNumber": 1, "number": 1},
+                {"id": 349235, "seriesId": 81189, "name": "Cat's in the Bag...", "seasonNumber": 1, "number": 2},
+                {"id": 438900, "name": "", "seasonNumber": 2, "number": 1},
+            ]
+        },
+        "links": {"next": None}
+    })
+
+    episodes = client.get_series_episodes_by_season(81189)
+
+    assert [episode["id"] for episode in episodes] == [349232, 349235, 438900]
+    assert episodes[2]["series_id"] == 81189
+    assert episodes[2]["name"] == "Untitled Episode"
+
+
+def test_series_episodes_filters_by_season(client, fake_api):
+    fake_api.reply("GET", "/series/81189/episodes/default", body={
+        "data": {
+            "series": {"id": 81189},
+            "episodes": [
+                {"id": 1, "seriesId": 81189, "name": "A", "seasonNumber": 2, "number": 1},
+                {"id": 2, "seriesId": 81189, "name": "B", "seasonNumber": 2, "number": 2},
+            ]
+        }
+    })
+
+    episodes = client.get_series_episodes_by_season(81189, 2)
+
+    assert [episode["id"] for episode in episodes] == [1, 2]
+    request = fake_api.calls("/episodes/default")[0]
+    assert parse_qs(urlsplit(request.url).query) == {"season": ["2"]}
+
+
+def test_shows_by_network_dedupes_before_limiting(client, fake_api):
+    fake_api.reply("GET", "/search", body={"data": [
+        {"id": "series-1", "name": "One"},
+        {"id": "series-1", "name": "One"},
+        {"id": "series-2", "name": "Two"},
+        {"id": "series-3", "name": "Three"},
+    ]})
+
+    shows = client.get_shows_by_network("HBO", limit=2)
+
+    assert [show["id"] for show in shows] == ["series-1", "series-2"]
+    assert len(fake_api.calls("/search")) == 1
+
+
+def test_shows_by_network_general_search_dedupes_before_limiting(client, fake_api):
+    def search(request):
+        query = parse_qs(urlsplit(request.url).query)
+        if "network" in query:
+            return 200, {"data": []}, {}
+        return 200, {"data": [
+            {"id": "series-1", "name": "HBO One"},
+            {"id": "series-1", "name": "HBO One"},
+            {"id": "series-2", "name": "Other", "overview": "An HBO drama"},
+            {"id": "series-3", "name": "Unrelated"},
+        ]}, {}
+
+    fake_api.route("GET", "/search", search)
+
+    shows = client.get_shows_by_network("HBO", limit=2)
+
+    assert [show["id"] for show in shows] == ["series-1", "series-2"]
+
+
+def test_response_ttl_picks_the_first_matching_endpoint():
+    assert _response_ttl("/awards/1") == 24 * 60 * 60
+    assert _response_ttl("/series/81189/nextAired") == 60
+    assert _response_ttl("/series/81189/extended") == 60 * 60
+    assert _response_ttl("/search") == 10 * 60
+    assert _response_ttl("/movies/1/cast") == client_module.DEFAULT_RESPONSE_TTL
+
+
+def test_get_responses_are_cached_for_their_ttl(client, fake_api, clock):
+    fake_api.reply("GET", "/series/1/extended", body={"data": {"id": 1, "name": "One"}})
+
+    assert client.get_series_details(1) == {"id": 1, "name": "One"}
+    clock.advance(60 * 60 - 1)
+    assert client.get_series_details(1) == {"id": 1, "name": "One"}
+    assert len(fake_api.calls("/series/1/extended")) == 1
+
+    clock.advance(1)
+    client.get_series_details(1)
+    assert len(fake_api.calls("/series/1/extended")) == 2
+
+
+def test_cached_responses_are_not_shared_with_callers(client, fake_api):
+    fake_api.reply("GET", "/series/1/extended", body={"data": {"id": 1, "genres": [{"name": "Drama"}]}})
+
+    details = client.get_series_details(1)
+    details["genres"].append({"name": "Comedy"})
+    details["name"] = "Changed"
+
+    assert client.get_series_details(1) == {"id": 1, "genres": [{"name": "Drama"}]}
+
+
+def test_fields_trim_the_response_but_not_the_cache(client, fake_api):
+    fake_api.reply("GET", "/movies/5/extended", body={"data": {
+        "id": 5,
+        "name": "Movie",
+        "characters": [{"personName": "Actor"}],
+    }})
+
+    assert client.get_movie_cast(5) == [{"personName": "Actor"}]
+    assert client._make_request("GET", "/movies/5/extended", fields={"name", "missing"}) == {
+        "data": {"name": "Movie"}
+    }
+    assert client.get_movie_details(5)["characters"] == [{"personName": "Actor"}]
+    assert len(fake_api.calls("/movies/5/extended")) == 1
+
+
+def test_stale_response_is_served_on_server_errors(client, fake_api, clock):
+    fake_api.reply("GET", "/series/1/extended", body={"data": {"id": 1}})
+    client.get_series_details(1)
+
+    clock.advance(60 * 60)
+    fake_api.reply("GET", "/series/1/extended", status=503, body={"message": "down"})
+    assert client.get_series_details(1) == {"id": 1}
+
+    clock.advance(client_module.STALE_RESPONSE_TTL)
+    with pytest.raises(TVDBError) as excinfo:
+        client.get_series_details(1)
+    assert excinfo.value.status_code == 503
+
+
+def test_stale_response_is_not_served_on_client_errors(client, fake_api, clock):
+    fake_api.reply("GET", "/series/1/extended", body={"data": {"id": 1}})
+    client.get_series_details(1)
+
+    clock.advance(60 * 60)
+    fake_api.reply("GET", "/series/1/extended", status=404, body={"message": "gone"})
+    with pytest.raises(TVDBError) as excinfo:
+        client.get_series_details(1)
+    assert excinfo.value.status_code == 404
+
+
+def test_expired_response_is_revalidated_with_its_etag(client, fake_api, clock):
+    fake_api.reply("GET", "/series/1/extended", body={"data": {"id": 1}}, headers={"ETag": '"v1"'})
+    client.get_series_details(1)
+
+    clock.advance(60 * 60)
+    fake_api.reply("GET", "/series/1/extended", status=304, body=b"")
+    assert client.get_series_details(1) == {"id": 1}
+    assert fake_api.calls("/series/1/extended")[-1].headers["If-None-Match"] == '"v1"'
+
+    # The 304 renews the entry for another full TTL
+    clock.advance(60 * 60 - 1)
+    assert client.get_series_details(1) == {"id": 1}
+    assert len(fake_api.calls("/series/1/extended")) == 2
+
+
+def test_rejected_token_triggers_one_login_and_a_retry(client, fake_api):
+    def extended(request):
+        if bearer(request) == "Bearer token-1":
+            return 401, {"message": "Unauthorized"}, {}
+        return 200, {"data": {"id": 1}}, {}
+
+    fake_api.route("GET", "/series/1/extended", extended)
+
+    assert client.get_series_details(1) == {"id": 1}
+    assert fake_api.logins == 2
+    assert [bearer(r) for r in fake_api.calls("/series/1/extended")] == ["Bearer token-1", "Bearer token-2"]
+
+
+def test_concurrent_401s_share_one_login(client, fake_api):
+    # Both requests are sent with the first token before either sees its 401
+    both_sent = threading.Barrier(2, timeout=5)
+
+    def extended(request):
+        if bearer(request) == "Bearer token-1":
+            both_sent.wait()
+            return 401, {"message": "Unauthorized"}, {}
+        return 200, {"data": {"id": 0}}, {}
+
+    fake_api.route("GET", "/series/1/extended", extended)
+    fake_api.route("GET", "/series/2/extended", extended)
+    client._ensure_token()
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda sid=sid: results.append(client.get_series_details(sid)))
+        for sid in (1, 2)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(5)
+
+    assert results == [{"id": 0}, {"id": 0}]
+    assert fake_api.logins == 2
+
+
+def test_stream_items_yields_items_under_the_prefix(client, fake_api):
+    fake_api.reply("GET", "/movies", body={"data": [{"id": 1, "score": 1.5}, {"id": 2}]})
+
+    assert list(client._stream_items("/movies")) == [{"id": 1, "score": 1.5}, {"id": 2}]
+
+
+def test_stream_items_logs_in_again_after_401(client, fake_api):
+    def movies(request):
+        if bearer(request) == "Bearer token-1":
+            return 401, {"message": "Unauthorized"}, {}
+        return 200, {"data": [{"id": 1}]}, {}
+
+    fake_api.route("GET", "/movies", movies)
+
+    assert list(client._stream_items("/movies")) == [{"id": 1}]
+    assert fake_api.logins == 2
+
+
+def test_stream_items_raises_on_errors_and_bad_json(client, fake_api):
+    fake_api.reply("GET", "/movies", status=404, body={"message": "missing"})
+    with pytest.raises(TVDBError) as excinfo:
+        list(client._stream_items("/movies"))
+    assert excinfo.value.status_code == 404
+
+    fake_api.reply("GET", "/movies", body=b'{"data": [{"id": 1}, {"id":')
+    with pytest.raises(TVDBError) as excinfo:
+        list(client._stream_items("/movies"))
+    assert excinfo.value.status_code == 500
+
+
+def test_token_is_saved_atomically_and_reused(make_client, fake_api, token_dir):
+    fake_api.reply("GET", "/series/1/extended", body={"data": {"id": 1}})
+    make_client().get_series_details(1)
+
+    saved = os.listdir(token_dir)
+    assert len(saved) == 1 and saved[0].endswith(".json")
+    path = token_dir / saved[0]
+    assert os.stat(path).st_mode & 0o777 == 0o600
+    assert orjson.loads(path.read_bytes())["token"] == "token-1"
+
+    # A second process picks up the saved token instead of logging in
+    second = make_client()
+    second.get_series_details(1)
+    assert fake_api.logins == 1
+    assert bearer(fake_api.calls("/series/1/extended")[-1]) == "Bearer token-1"
+
+
+@pytest.mark.parametrize("contents", [
+    b'{"token": "old", "token_expires": 0}',
+    b'{"token": "half-writt',
+])
+def test_unusable_saved_token_is_ignored(make_client, fake_api, token_dir, contents):
+    first = make_client()
+    with open(first._token_cache_path(), "wb") as f:
+        f.write(contents)
+
+    fake_api.reply("GET", "/series/1/extended", body={"data": {"id": 1}})
+    first.get_series_details(1)
+
+    assert fake_api.logins == 1
+    assert bearer(fake_api.calls("/series/1/extended")[-1]) == "Bearer token-1"
+    assert orjson.loads(open(first._token_cache_path(), "rb").read())["token"] == "token-1"
+    assert time.time() < first.token_expires